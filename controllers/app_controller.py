@@ -1,5 +1,7 @@
-from PyQt5.QtCore import QObject, pyqtSignal, QTimer
+from PyQt5.QtCore import QObject, pyqtSignal
 import numpy as np
+import re
+import threading
 import time
 import yaml
 
@@ -11,6 +13,9 @@ from models.robot_model import RobotModel
 from models.vision_model import VisionModel
 
 logger = get_logger("Controller")
+
+# Overlay renders kept for reuse: one per paused view state (orig, thres, contours)
+OVERLAY_CACHE_SIZE = 3
 with open('config.yml', 'r') as file:
     config = yaml.safe_load(file)
 
@@ -51,6 +56,8 @@ class AppController(QObject):
     # Signals
     cell_index_changed = pyqtSignal(int)
     cell_max_changed = pyqtSignal(int)
+    # C-contiguous HxWx3 uint8 ndarray that is never written after it is emitted. Overlay cache
+    # hits re-emit the same array object, so receivers may key caches on its identity
     frame_updated = pyqtSignal(object)
     status_message = pyqtSignal(str)
     robot_status_message = pyqtSignal(str)
@@ -59,6 +66,7 @@ class AppController(QObject):
     state_mode_updated = pyqtSignal(str, str)  # state, mode
     robot_connection_status_changed = pyqtSignal(bool)  # is_connected
     camera_connection_status_changed = pyqtSignal(bool)  # is_connected
+    preview_frame_ready = pyqtSignal(object)  # camera frame ndarray or None, from request_preview_frame
 
     # State machine states
     STATE_IDLE = "IDLE"
@@ -152,8 +160,18 @@ class AppController(QObject):
         # List to store cross positions
         self.cross_positions = []
         
-        # Store last displayed frame for saving
+        # Last displayed frame, for saving; shared with _overlay_cache, so never modify it in place
         self.last_displayed_frame = None
+        
+        # Set while a preview frame is being fetched off the GUI thread
+        self._preview_pending = False
+        
+        # Render image views through OpenGL (views fall back to software if it is unavailable)
+        self.opengl_viewport = config.get("display", {}).get("opengl_viewport", True)
+        
+        # Recent overlay renders as (inputs key, canvas), newest first; a canvas is re-emitted
+        # as-is while its inputs match, so flipping between view states does not redraw
+        self._overlay_cache = []
     
     def _init_state_machine(self):
         """Initialize state machine variables"""
@@ -232,9 +250,8 @@ class AppController(QObject):
         """
         success = self.vision.capture_and_process()
         if success:
-            self._update_centroids()
-            frame = self._get_frame_for_display(self.current_view_state)
-            self._prepare_and_emit_frame(frame)
+            # Centroids and the display are refreshed by _on_frame_processed, driven by
+            # the vision model's frame_processed signal before capture_and_process returns
             self.status_message.emit("Capture complete")
         else:
             logger.error("Capture/process failed")
@@ -245,39 +262,66 @@ class AppController(QObject):
         """Draw cells and cross on frame then emit"""
         if frame is None:
             return
-            
-        # Make a copy to avoid modifying the original
-        frame = frame.copy()
         
-        # Draw bounding boxes from current section config
+        # Bounding boxes from current section config
+        bounding_boxes = []
         if self.show_bounding_boxes:
             current_section = self.section_config.get(self.current_display_section, {})
             bounding_boxes = current_section.get("bounding_boxes", [])
-            frame = draw_boundary_box(frame, bounding_boxes)
+        
+        # Re-emit an earlier render when neither its frame nor any overlay input changed.
+        # Row indices and boxes are small and can change in place, so they are keyed by value
+        cross_x, cross_y = self.cross_manager.cam_xy
+        key = (frame, self.centroid_manager.centroids, draw_cells, self.show_centroids,
+               tuple(self.centroid_manager._row_indices), tuple(tuple(box) for box in bounding_boxes),
+               self.current_display_section, float(cross_x), float(cross_y))
+        cached = self._find_cached_overlay(key)
+        if cached is not None:
+            self.last_displayed_frame = cached
+            self.frame_updated.emit(cached)
+            return
+        
+        # The first overlay copies the source frame into a fresh BGR buffer (the original
+        # is never modified); every later overlay draws into that same buffer in place
+        frame = draw_boundary_box(frame, bounding_boxes, out=np.empty(frame.shape[:2] + (3,), dtype=np.uint8))
         
         # Add overlay with centroids if available and requested
         if draw_cells and self.show_centroids and self.centroid_manager.centroids is not None:
-            frame = draw_points(
+            draw_points(
                 frame, 
                 self.centroid_manager.centroids, 
                 -1,  # No current index 
                 size=5,
-                row_indices=self.centroid_manager._row_indices
+                row_indices=self.centroid_manager._row_indices,
+                out=frame
             )
         
         # Draw cross on frame before emitting
-        cross_x, cross_y = self.cross_manager.cam_xy
-        frame = draw_cross(frame, cross_x, cross_y)
+        draw_cross(frame, cross_x, cross_y, out=frame)
         
         # Add 1px border
-        frame = add_border(frame, color=(0, 0, 0), thickness=1)
+        add_border(frame, color=(0, 0, 0), thickness=1, out=frame)
         
-        # Store the prepared frame for saving
-        self.last_displayed_frame = frame.copy()
+        # Store the prepared frame for saving (the buffer is not touched after emit). It is
+        # the same array as the overlay cache entry, so it must be treated as read-only
+        self.last_displayed_frame = frame
+        self._overlay_cache = [(key, frame)] + self._overlay_cache[:OVERLAY_CACHE_SIZE - 1]
         
         # Emit the prepared frame
         self.frame_updated.emit(frame)
     
+    def _find_cached_overlay(self, key):
+        """
+        Return the cached render whose inputs match key, or None.
+        Frame and centroid list are compared by identity: the vision model and centroid
+        manager replace them with new objects on every update, and holding them in the
+        key keeps their ids from being recycled.
+        """
+        for cached_key, canvas in self._overlay_cache:
+            if cached_key[0] is key[0] and cached_key[1] is key[1] and cached_key[2:] == key[2:]:
+                return canvas
+        return None
+    
     def _get_frame_for_display(self, view_state):
         """Get appropriate frame based on view state."""
         if view_state == "paused orig":
@@ -857,6 +901,26 @@ class AppController(QObject):
         """Reconnect camera"""
         self.vision.reconnect_camera()
     
+    def request_preview_frame(self):
+        """
+        Fetch a preview frame on a worker thread so camera latency does not block the UI.
+        The result is delivered through preview_frame_ready; requests made while a fetch
+        is still running are dropped.
+        """
+        if self._preview_pending:
+            return
+        self._preview_pending = True
+        threading.Thread(target=self._fetch_preview_frame, daemon=True).start()
+    
+    def _fetch_preview_frame(self):
+        """Worker thread body for request_preview_frame"""
+        try:
+            frame = self.get_preview_frame()
+        finally:
+            self._preview_pending = False
+        # Camera frames are freshly allocated per grab, so no copy is needed to cross threads
+        self.preview_frame_ready.emit(frame)
+    
     def get_preview_frame(self):
         """
         Get latest frame from camera for preview.
@@ -907,7 +971,6 @@ class AppController(QObject):
     def _save_exposure_time_to_config(self, value: float):
         """Save exposure time value to config file - updates only the specific value."""
         try:
-            import re
             with open('config.yml', 'r') as file:
                 content = file.read()
             
@@ -948,7 +1011,6 @@ class AppController(QObject):
     def _save_threshold_to_config(self, value: int):
         """Save threshold value to config file - updates only the specific value."""
         try:
-            import re
             with open('config.yml', 'r') as file:
                 content = file.read()
             
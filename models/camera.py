@@ -4,6 +4,7 @@ import cv2 as cv
 from abc import ABC, abstractmethod
 import yaml
 import time
+import threading
 
 # Add the project root directory to the Python path
 project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
@@ -148,7 +149,6 @@ class PylonCamera(CameraBase):
             logger.info(f"Attempting direct connection to camera at {camera_ip}")
             
             # Set environment variables for better GigE performance
-            import os
             os.environ['PYLON_GIGE_HEARTBEAT_EXTENDED_TIMEOUT'] = '10000'
             os.environ['PYLON_GIGE_DISCOVERY_EXTENDED_TIMEOUT'] = '10000'
             
@@ -378,9 +378,16 @@ class CameraHandler:
         self.cam_type = cam_type if cam_type is not None else config.get("cam_type", "usb")
         self.cam_num = cam_num if cam_num is not None else config.get("cam_num", 0)
         self.file_path = file_path if file_path is not None else config.get("img_path", None)
+        # Frames can be fetched from a worker thread (preview), so camera access is serialized
+        self._lock = threading.Lock()
 
     def initialize_camera(self) -> bool:
         """Initialize the appropriate camera type."""
+        with self._lock:
+            return self._initialize_camera()
+
+    def _initialize_camera(self) -> bool:
+        """initialize_camera body, called with the camera lock held"""
         try:
             if self.cam_type == "usb":
                 self.camera = USBCamera(self.cam_num)
@@ -404,13 +411,15 @@ class CameraHandler:
 
     def get_frame(self):
         """Delegate frame capture to the selected camera."""
-        return None if self.camera is None else self.camera.get_frame()
+        with self._lock:
+            return None if self.camera is None else self.camera.get_frame()
 
     def release(self):
         """Delegate resource cleanup to the selected camera."""
-        if self.camera:
-            self.camera.release()
-            self.camera = None
+        with self._lock:
+            if self.camera:
+                self.camera.release()
+                self.camera = None
             
     def reconnect(self) -> bool:
         """Reconnect the camera by releasing and reconnecting it."""
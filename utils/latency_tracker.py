@@ -0,0 +1,33 @@
+"""
+Latency Tracker Utility
+=======================
+Collects GUI timing samples (paint time, frame delivery delay) and periodically
+logs their percentiles, to guide tuning of the frame render path.
+"""
+
+import time
+
+import numpy as np
+
+
+class LatencyTracker:
+    """
+    Accumulates durations in seconds and logs p50/p95 in milliseconds every
+    interval_s while samples keep arriving. Idle periods log nothing.
+    """
+    def __init__(self, name, logger, interval_s=5.0):
+        self.name = name
+        self.logger = logger
+        self.interval_s = interval_s
+        self._samples = []
+        self._last_report = time.perf_counter()
+
+    def add(self, seconds):
+        """Record one duration and report if the interval has elapsed"""
+        self._samples.append(seconds)
+        now = time.perf_counter()
+        if now - self._last_report >= self.interval_s:
+            self._last_report = now
+            p50, p95 = np.percentile(self._samples, [50, 95]) * 1000
+            self.logger.debug(f"{self.name}: p50 {p50:.1f} ms, p95 {p95:.1f} ms ({len(self._samples)} samples)")
+            self._samples.clear()
@@ -20,8 +20,32 @@ def save_image(image, folder):
     cv.imwrite(path, image_bgr)
     print(f"Image saved to {path}")
 
-def draw_cross(image, x, y, color=(0, 255, 0), size=200):
-    """Draw a cross marker on the image at the specified coordinates."""
+def _draw_target(image, out):
+    """
+    Return the array an overlay is drawn on.
+    
+    Without out, grayscale images are converted to a new BGR array and color images
+    are drawn on directly. With out, image is copied (or converted) into out unless
+    it already is out, so chained overlays can share one preallocated buffer.
+    """
+    is_gray = len(image.shape) == 2 or image.shape[2] == 1
+    if out is None:
+        return cv.cvtColor(image, cv.COLOR_GRAY2BGR) if is_gray else image
+    if out is not image:
+        if is_gray:
+            cv.cvtColor(image, cv.COLOR_GRAY2BGR, dst=out)
+        else:
+            np.copyto(out, image)
+    return out
+
+def draw_cross(image, x, y, color=(0, 255, 0), size=200, out=None):
+    """
+    Draw a cross marker on the image at the specified coordinates.
+    If out is given, the result is written into it (see _draw_target).
+    """
+    if out is not None:
+        image = _draw_target(image, out)
+    
     # Convert coordinates to integers
     x_int = int(x)
     y_int = int(y)
@@ -41,7 +65,7 @@ def draw_cross(image, x, y, color=(0, 255, 0), size=200):
     
     return image
 
-def draw_points(image, points, current_index=None, size=3, row_indices=None):
+def draw_points(image, points, current_index=None, size=3, row_indices=None, out=None):
     """
     Draw circles at the specified points on the image.
     
@@ -51,16 +75,16 @@ def draw_points(image, points, current_index=None, size=3, row_indices=None):
         current_index: Not used anymore, kept for backward compatibility
         size: Size of circles to draw
         row_indices: List of indices where new rows start (optional)
+        out: Optional preallocated BGR buffer to draw into (may be image itself)
         
     Returns:
         Image with circles drawn
     """
     if points is None:
-        return image
+        return image if out is None else _draw_target(image, out)
     
-    # Check if the image is grayscale
-    if len(image.shape) == 2 or image.shape[2] == 1:  # Grayscale image
-        image = cv.cvtColor(image, cv.COLOR_GRAY2BGR)
+    # Convert grayscale to BGR (into out when given)
+    image = _draw_target(image, out)
 
     # Define colors for different groups (BGR format)
     group_colors = [
@@ -125,7 +149,7 @@ def determine_bound(point, crop_region):
 
     return False
 
-def add_border(image, color=(0, 0, 0), thickness=1):
+def add_border(image, color=(0, 0, 0), thickness=1, out=None):
     """
     Adds a border around the image with specified color and thickness.
     
@@ -133,42 +157,46 @@ def add_border(image, color=(0, 0, 0), thickness=1):
         image: The input image (numpy array)
         color: Border color in BGR format (default: black)
         thickness: Border thickness in pixels (default: 1px)
+        out: Optional preallocated BGR buffer to draw into (may be image itself)
         
     Returns:
         Image with border added
     """
-    # Make a copy to avoid modifying the original
-    img_with_border = image.copy()
+    if out is not None:
+        img_with_border = _draw_target(image, out)
+    else:
+        # Make a copy to avoid modifying the original
+        img_with_border = image.copy()
+        
+        # If grayscale, convert to BGR for the border
+        if len(img_with_border.shape) == 2:
+            img_with_border = cv.cvtColor(img_with_border, cv.COLOR_GRAY2BGR)
     
     # Get image dimensions
     h, w = img_with_border.shape[:2]
     
-    # If grayscale, convert to BGR for the border
-    if len(img_with_border.shape) == 2:
-        img_with_border = cv.cvtColor(img_with_border, cv.COLOR_GRAY2BGR)
-    
     # Draw rectangle around the edge
     cv.rectangle(img_with_border, (0, 0), (w-1, h-1), color, thickness)
     
     return img_with_border
 
-def draw_boundary_box(image, bounding_boxes):
+def draw_boundary_box(image, bounding_boxes, out=None):
     """
     Draw bounding boxes based on bounding box list configuration.
     
     Args:
         image: The input image (numpy array)
         bounding_boxes: List of [x_min, y_min, x_max, y_max] coordinates
+        out: Optional preallocated BGR buffer to draw into (may be image itself)
         
     Returns:
         Image with bounding boxes drawn in red
     """
     if bounding_boxes is None or len(bounding_boxes) == 0:
-        return image
+        return image if out is None else _draw_target(image, out)
     
-    # Check if the image is grayscale and convert to BGR if needed
-    if len(image.shape) == 2 or image.shape[2] == 1:  # Grayscale image
-        image = cv.cvtColor(image, cv.COLOR_GRAY2BGR)
+    # Convert grayscale to BGR (into out when given)
+    image = _draw_target(image, out)
     
     # Draw each bounding box
     for bbox in bounding_boxes:
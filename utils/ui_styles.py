@@ -3,9 +3,13 @@ UI Stylesheet Utilities
 =======================
 Centralized stylesheet definitions for consistent UI styling across the application.
 """
+from functools import lru_cache
+from types import MappingProxyType
 
-# Color Palette
-COLORS = {
+from PyQt5.QtGui import QColor, QPalette
+
+# Color Palette (read-only; the stylesheet is built from it once)
+COLORS = MappingProxyType({
     'blue': '#4A9EFF',
     'blue_dark': '#2A5F8F',
     'blue_light': '#6BB6FF',
@@ -41,6 +45,7 @@ COLORS = {
     'gray_dark': '#555',
     'gray_bg': '#2A2A2A',
     'gray_bg_dark': '#2b2b2b',
+    'gray_panel': '#353535',
     
     'brown': '#8B5A2B',
     'brown_light': '#9B6A3B',
@@ -52,12 +57,28 @@ COLORS = {
     
     'text_light': '#E0E0E0',
     'white': 'white',
-}
+})
+
+@lru_cache(maxsize=None)
+def get_qcolor(name: str):
+    """QColor for a COLORS key, parsed once and shared (treat the result as read-only)"""
+    return QColor(COLORS[name])
 
-def group_box_primary(color: str) -> str:
+@lru_cache(maxsize=None)
+def get_status_palette(color: str):
+    """
+    Palette whose text color is `color`, for status lights. Shared per color (treat as
+    read-only); setPalette avoids the stylesheet parse and re-polish of setStyleSheet.
+    Needs a QApplication, since it starts from the application palette.
+    """
+    palette = QPalette()
+    palette.setColor(QPalette.WindowText, QColor(color))
+    return palette
+
+def group_box_primary(color: str, selector: str = "QGroupBox") -> str:
     """Style for primary group boxes with colored borders"""
     return f"""
-        QGroupBox {{
+        {selector} {{
             font-weight: bold;
             color: {color};
             border: 2px solid {color};
@@ -65,24 +86,24 @@ def group_box_primary(color: str) -> str:
             margin-top: 10px;
             padding-top: 10px;
         }}
-        QGroupBox::title {{
+        {selector}::title {{
             subcontrol-origin: margin;
             left: 10px;
             padding: 0 5px;
         }}
     """
 
-def group_box_secondary() -> str:
+def group_box_secondary(selector: str = "QGroupBox") -> str:
     """Style for secondary/nested group boxes"""
     return f"""
-        QGroupBox {{
+        {selector} {{
             color: {COLORS['gray_muted']};
             border: 1px solid {COLORS['gray_dark']};
             border-radius: 3px;
             margin-top: 5px;
             padding-top: 5px;
         }}
-        QGroupBox::title {{
+        {selector}::title {{
             subcontrol-origin: margin;
             left: 10px;
             padding: 0 5px;
@@ -93,112 +114,121 @@ def label_muted() -> str:
     """Style for muted labels"""
     return f"color: {COLORS['gray_muted']};"
 
-def button_toggle_blue() -> str:
+def status_strip(selector: str = "*") -> str:
+    """Style for the status strip under the vision display"""
+    return f"""
+        {selector} {{
+            background-color: {COLORS['gray_panel']};
+            border: 1px solid {COLORS['gray_dark']};
+        }}
+    """
+
+def button_toggle_blue(selector: str = "QPushButton") -> str:
     """Style for blue toggle buttons (frame type buttons)"""
     return f"""
-        QPushButton {{
+        {selector} {{
             background-color: {COLORS['blue_dark']};
             color: {COLORS['white']};
             border: 2px solid {COLORS['blue']};
             border-radius: 4px;
             padding: 5px;
         }}
-        QPushButton:checked {{
+        {selector}:checked {{
             background-color: {COLORS['blue']};
             border: 2px solid {COLORS['blue_light']};
         }}
-        QPushButton:hover {{
+        {selector}:hover {{
             background-color: {COLORS['blue_hover']};
         }}
     """
 
-def button_toggle_green() -> str:
+def button_toggle_green(selector: str = "QPushButton") -> str:
     """Style for green toggle buttons (display options)"""
     return f"""
-        QPushButton {{
+        {selector} {{
             background-color: {COLORS['green_dark']};
             color: {COLORS['white']};
             border: 2px solid {COLORS['green']};
             border-radius: 4px;
             padding: 5px;
         }}
-        QPushButton:checked {{
+        {selector}:checked {{
             background-color: {COLORS['green']};
             border: 2px solid {COLORS['green_light']};
         }}
-        QPushButton:hover {{
+        {selector}:hover {{
             background-color: {COLORS['green_hover']};
         }}
     """
 
-def button_toggle_green_speed() -> str:
+def button_toggle_green_speed(selector: str = "QPushButton") -> str:
     """Style for green speed toggle buttons"""
     return f"""
-        QPushButton {{
+        {selector} {{
             background-color: {COLORS['green_speed_dark']};
             color: {COLORS['white']};
             border: 2px solid {COLORS['green_speed']};
             border-radius: 4px;
             padding: 5px;
         }}
-        QPushButton:checked {{
+        {selector}:checked {{
             background-color: {COLORS['green_speed']};
             border: 2px solid {COLORS['green_speed_light']};
         }}
-        QPushButton:hover {{
+        {selector}:hover {{
             background-color: {COLORS['green_speed_hover']};
         }}
     """
 
-def button_action() -> str:
+def button_action(selector: str = "QPushButton") -> str:
     """Style for standard action buttons (gray)"""
     return f"""
-        QPushButton {{
+        {selector} {{
             background-color: {COLORS['gray']};
             color: {COLORS['white']};
             border: 1px solid {COLORS['gray_border']};
             border-radius: 4px;
             padding: 5px;
         }}
-        QPushButton:hover {{
+        {selector}:hover {{
             background-color: {COLORS['gray_light']};
         }}
     """
 
-def button_save() -> str:
+def button_save(selector: str = "QPushButton") -> str:
     """Style for save button (brown)"""
     return f"""
-        QPushButton {{
+        {selector} {{
             background-color: {COLORS['brown']};
             color: {COLORS['white']};
             border: 1px solid {COLORS['brown_border']};
             border-radius: 4px;
             padding: 5px;
         }}
-        QPushButton:hover {{
+        {selector}:hover {{
             background-color: {COLORS['brown_light']};
         }}
     """
 
-def button_capture() -> str:
+def button_capture(selector: str = "QPushButton") -> str:
     """Style for capture button (dark brown)"""
     return f"""
-        QPushButton {{
+        {selector} {{
             background-color: {COLORS['brown_capture']};
             color: {COLORS['white']};
             border: 1px solid {COLORS['brown_capture_border']};
             border-radius: 4px;
             padding: 5px;
         }}
-        QPushButton:hover {{
+        {selector}:hover {{
             background-color: {COLORS['brown_capture_light']};
         }}
     """
 
-def button_motor() -> str:
+def button_motor(selector: str = "QPushButton") -> str:
     """Style for motor toggle button (red)"""
     return f"""
-        QPushButton {{
+        {selector} {{
             background-color: {COLORS['red_dark']};
             color: {COLORS['white']};
             border: 2px solid {COLORS['red']};
@@ -206,19 +236,19 @@ def button_motor() -> str:
             padding: 8px;
             font-weight: bold;
         }}
-        QPushButton:checked {{
+        {selector}:checked {{
             background-color: {COLORS['red']};
             border: 2px solid {COLORS['red_light']};
         }}
-        QPushButton:hover {{
+        {selector}:hover {{
             background-color: {COLORS['red_hover']};
         }}
     """
 
-def button_move() -> str:
+def button_move(selector: str = "QPushButton") -> str:
     """Style for move button (purple)"""
     return f"""
-        QPushButton {{
+        {selector} {{
             background-color: {COLORS['purple']};
             color: {COLORS['white']};
             border: 2px solid {COLORS['purple_light']};
@@ -226,19 +256,19 @@ def button_move() -> str:
             padding: 8px;
             font-weight: bold;
         }}
-        QPushButton:hover {{
+        {selector}:hover {{
             background-color: {COLORS['purple_hover']};
         }}
     """
 
-def button_reconnect() -> str:
+def button_reconnect(selector: str = "QPushButton") -> str:
     """Style for reconnect buttons"""
-    return button_action()  # Same as action buttons
+    return button_action(selector)  # Same as action buttons
 
-def text_edit_dark() -> str:
+def text_edit_dark(selector: str = "QTextEdit") -> str:
     """Style for dark text edit fields"""
     return f"""
-        QTextEdit {{
+        {selector} {{
             background-color: {COLORS['gray_bg']};
             color: {COLORS['text_light']};
             border: 1px solid {COLORS['gray_dark']};
@@ -247,20 +277,20 @@ def text_edit_dark() -> str:
         }}
     """
 
-def ping_table_widget_style() -> str:
+def ping_table_widget_style(selector: str = "QWidget") -> str:
     """Style for ping table widget"""
     return f"""
-        QWidget {{
+        {selector} {{
             border: 1px solid {COLORS['gray_dark']};
             border-radius: 4px;
             background-color: {COLORS['gray_bg_dark']};
         }}
     """
 
-def spinbox_dark() -> str:
-    """Style for dark spinbox"""
+def line_edit_dark(selector: str = "QLineEdit") -> str:
+    """Style for dark line edit fields"""
     return f"""
-        QSpinBox {{
+        {selector} {{
             background-color: {COLORS['gray_bg']};
             color: {COLORS['white']};
             border: 1px solid {COLORS['gray_dark']};
@@ -269,3 +299,47 @@ def spinbox_dark() -> str:
         }}
     """
 
+# Primary group box object names and their border colors
+GROUP_BOX_COLORS = MappingProxyType({
+    'groupBlue': COLORS['blue'],
+    'groupOrange': COLORS['orange'],
+    'groupRed': COLORS['red'],
+    'groupPurple': COLORS['purple'],
+    'groupCyan': COLORS['cyan'],
+})
+
+@lru_cache(maxsize=None)
+def build_global_qss() -> str:
+    """
+    Build the application-wide stylesheet.
+
+    Widgets opt into a style with setObjectName() instead of carrying their own
+    stylesheet, so Qt parses the rules once and polishes every widget in a single pass.
+    """
+    blocks = [group_box_primary(color, f"QGroupBox#{name}") for name, color in GROUP_BOX_COLORS.items()]
+    blocks += [
+        group_box_secondary("QGroupBox#groupSecondary"),
+        # Secondary boxes sit inside primary ones and used to inherit their bold title
+        "QGroupBox#groupSecondary { font-weight: bold; }",
+        f"QLabel#muted {{ {label_muted()} }}",
+        "QLabel#muted:disabled { color: gray; }",
+        f"QLabel#coordLabel {{ {label_muted()} min-width: 30px; }}",
+        # Engineer tab controls share one font size instead of a setFont call per widget
+        "QWidget#engineerTab QPushButton, QWidget#engineerTab QLineEdit { font-size: 14pt; }",
+        "QWidget#engineerTab QPushButton[compact=\"true\"] { font-size: 12pt; }",
+        button_toggle_blue("QPushButton#toggleBlue"),
+        button_toggle_green("QPushButton#toggleGreen"),
+        button_toggle_green_speed("QPushButton#toggleGreenSpeed"),
+        button_action("QPushButton#action"),
+        button_save("QPushButton#save"),
+        button_capture("QPushButton#capture"),
+        button_motor("QPushButton#motor"),
+        button_move("QPushButton#move"),
+        button_reconnect("QPushButton#reconnect"),
+        text_edit_dark("QPlainTextEdit#history"),
+        ping_table_widget_style("QWidget#pingTable"),
+        line_edit_dark("QLineEdit#coord"),
+        status_strip("QFrame#statusStrip, QFrame#statusStrip *"),
+        "QFrame#statusStrip QLabel { font-size: 18pt; }",
+    ]
+    return "".join(blocks)
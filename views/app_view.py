@@ -1,42 +1,95 @@
-from PyQt5.QtCore import Qt
-from PyQt5.QtWidgets import (QVBoxLayout, QHBoxLayout, QWidget, QTabWidget, 
-                             QSplitter, QFrame, QLabel)
+from PyQt5.QtCore import Qt, QTimer, QElapsedTimer, QEvent
+from PyQt5.QtWidgets import (QApplication, QVBoxLayout, QHBoxLayout, QWidget, QTabWidget, 
+                             QSplitter, QFrame, QLabel, QGraphicsScene, QStackedWidget)
 from PyQt5.QtGui import QFont
+import os
 import signal
+import time
 
 from utils.logger_config import get_logger
+from utils.ui_styles import build_global_qss
+from utils.latency_tracker import LatencyTracker
 from views.engineer_tab_view import EngineerTabView
 from views.user_tab_view import UserTabView
 from views.graphics_view import GraphicsView
+from views.frame_label import FrameLabel
 
 # Configure the logger
 logger = get_logger("View")
 
+# Robot states that mean a run is in progress
+_BUSY_STATES = frozenset({"INSERTING", "TESTING", "QUEUEING"})
+
 class AppView(QWidget):
     """
     Main view component that handles UI presentation.
     Manages tabs and coordinates between different view components.
     Uses A1 layout: splitter with left panel (tabs) and right panel (vision + status).
     """
+    # Cross shift (dx, dy) per (arrow key, Shift held); Shift moves in half steps
+    _ARROW_SHIFTS = {
+        (key, shift_held): (dx * step, dy * step)
+        for key, (dx, dy) in {
+            Qt.Key_Left: (-1, 0),
+            Qt.Key_Right: (1, 0),
+            Qt.Key_Up: (0, -1),
+            Qt.Key_Down: (0, 1),
+        }.items()
+        for shift_held, step in ((False, 1), (True, 0.5))
+    }
+    
     def __init__(self, controller):
         super().__init__()
         self.controller = controller
         
-        # Touch-optimized font sizes
-        self.font_large = QFont()
-        self.font_large.setPointSize(24)
+        # Touch-optimized font sizes, shared by every widget in both tabs
+        # (status strip labels get theirs from the global stylesheet)
         self.font_medium = QFont()
         self.font_medium.setPointSize(18)
         self.font_normal = QFont()
         self.font_normal.setPointSize(14)
         
+        # Apply all widget styles once, application-wide, before any widget is polished
+        QApplication.instance().setStyleSheet(build_global_qss())
+        
+        # Latest frame from the controller; redrawn at most once per display refresh
+        self._pending_frame = None
+        self._dirty = False
+        self._last_frame = None  # Kept so the operator label can rescale it on resize
+        # Time from a frame's arrival to the end of its render (throttle wait + update_display)
+        self._pending_since = 0.0
+        self.frame_latency = LatencyTracker("Frame arrival to render", logger)
+        refresh_rate = QApplication.primaryScreen().refreshRate() if QApplication.primaryScreen() else 0
+        self._frame_interval_ms = 1000.0 / (refresh_rate if refresh_rate > 0 else 60.0)
+        self._frame_timer = QTimer(self)
+        self._frame_timer.setSingleShot(True)
+        self._frame_timer.setTimerType(Qt.PreciseTimer)
+        self._frame_timer.timeout.connect(self._render_pending_frame)
+        self._since_render = QElapsedTimer()
+        
+        # Arrow-key cross shifts accumulated until the next event-loop pass
+        self._pending_shift = [0, 0]
+        self._shift_flush_scheduled = False
+        
+        # Label texts per (state, mode); the state machine only has a handful of them
+        self._state_mode_texts = {}
+        
+        # Status label texts waiting for the next coalesced repaint, keyed by label
+        self._pending_status = {}
+        self._status_timer = QTimer(self)
+        self._status_timer.setSingleShot(True)
+        self._status_timer.setInterval(50)
+        self._status_timer.timeout.connect(self._flush_status_labels)
+        
+        # Set in closeEvent so deferred redraws/shifts queued before teardown are dropped
+        self._closed = False
+        
         # Setup UI components
         self.setup_ui()
         
         # Connect signals from controller to view methods
-        self.controller.frame_updated.connect(self.engineer_tab.update_display)
+        self.controller.frame_updated.connect(self._on_frame_updated)
         self.controller.status_message.connect(self.update_status_message)
-        self.controller.section_changed.connect(self.engineer_tab.update_section_display)
         self.controller.robot_status_message.connect(self.update_robot_status)
         self.controller.position_updated.connect(self.engineer_tab.update_position_info)
         self.controller.state_mode_updated.connect(self.update_state_mode)
@@ -47,13 +100,13 @@ class AppView(QWidget):
 
     def setup_ui(self):
         """Initialize the user interface."""
-        from PyQt5.QtWidgets import QGraphicsScene
-        
         self.setWindowTitle("Vision Control Interface")
         self.setGeometry(100, 100, 1600, 1000)
 
         # Create shared scene for vision display (before creating tabs)
         self.vision_scene = QGraphicsScene(self)
+        # Only ever holds the frame pixmap, so a BSP index would just be rebuilt for nothing
+        self.vision_scene.setItemIndexMethod(QGraphicsScene.NoIndex)
 
         # Create main layout
         main_layout = QHBoxLayout(self)
@@ -75,8 +128,10 @@ class AppView(QWidget):
         # Set splitter proportions (40% left, 60% right)
         splitter.setSizes([500, 1100])
         
-        # Connect engineer tab's scene to shared vision scene
+        # Connect engineer tab to the shared vision scene and display widgets
         self.engineer_tab.scene = self.vision_scene
+        self.engineer_tab.vision_view = self.vision_view
+        self.engineer_tab.frame_label = self.frame_label
     
     def create_left_panel(self):
         """Create left panel with tabs"""
@@ -107,12 +162,23 @@ class AppView(QWidget):
         self.vision_view = GraphicsView(self)
         self.vision_view.main_window = self  # Store reference for click handling
         self.vision_view.setScene(self.vision_scene)
-        layout.addWidget(self.vision_view)
+        if getattr(self.controller, 'opengl_viewport', True) and not self.vision_view.use_opengl_viewport():
+            logger.warning("OpenGL unavailable, vision view falls back to software rendering")
+        
+        # Operator tab has no zoom/pan/click, so it shows frames on a plain label instead
+        self.frame_label = FrameLabel()
+        self.frame_label.resized.connect(self._on_frame_label_resized)
+        
+        self.display_stack = QStackedWidget()
+        self.display_stack.addWidget(self.vision_view)
+        self.display_stack.addWidget(self.frame_label)
+        self.display_stack.setCurrentWidget(self.vision_view if self.tab_widget.currentIndex() == 1 else self.frame_label)
+        layout.addWidget(self.display_stack)
         
         # Status strip
         status_strip = QFrame()
         status_strip.setFrameShape(QFrame.StyledPanel)
-        status_strip.setStyleSheet("background-color: #353535; border: 1px solid #555555;")
+        status_strip.setObjectName("statusStrip")
         status_strip.setMinimumHeight(80)
         status_layout = QVBoxLayout(status_strip)
         status_layout.setContentsMargins(15, 10, 15, 10)
@@ -121,9 +187,7 @@ class AppView(QWidget):
         # Status row
         status_row = QHBoxLayout()
         self.current_status = QLabel("Status: Ready")
-        self.current_status.setFont(self.font_medium)
         self.state_mode_label = QLabel("State: IDLE | Mode: IDLE MODE")
-        self.state_mode_label.setFont(self.font_medium)
         status_row.addWidget(self.current_status)
         status_row.addStretch()
         status_row.addWidget(self.state_mode_label)
@@ -132,11 +196,8 @@ class AppView(QWidget):
         # Action row
         action_row = QHBoxLayout()
         self.robot_status = QLabel("Robot: Idle")
-        self.robot_status.setFont(self.font_medium)
         self.vision_status = QLabel("Vision: Ready")
-        self.vision_status.setFont(self.font_medium)
         self.general_status = QLabel("General: OK")
-        self.general_status.setFont(self.font_medium)
         
         action_row.addWidget(self.robot_status)
         separator1 = QFrame()
@@ -156,6 +217,37 @@ class AppView(QWidget):
         
         return panel
 
+    def _on_frame_updated(self, frame):
+        """Stash the newest frame and schedule one redraw, no sooner than one refresh after the last"""
+        self._pending_frame = frame
+        self._pending_since = time.perf_counter()
+        if not self._dirty:
+            self._dirty = True
+            # Frames arriving while the redraw is pending just replace the stashed one
+            elapsed = self._since_render.elapsed() if self._since_render.isValid() else self._frame_interval_ms
+            self._frame_timer.start(max(0, int(self._frame_interval_ms - elapsed)))
+    
+    def _render_pending_frame(self):
+        """Render the latest stashed frame, skipping the work if nothing changed"""
+        if self._closed or not self._dirty:
+            return
+        # Nothing is on screen; stay dirty so later frames only replace the stashed one,
+        # and render it once the window is shown again
+        if self.isMinimized() or not self.display_stack.isVisible():
+            return
+        self._dirty = False
+        frame, self._pending_frame = self._pending_frame, None
+        self._last_frame = frame
+        self._since_render.start()
+        self.engineer_tab.update_display(frame)
+        self.frame_latency.add(time.perf_counter() - self._pending_since)
+    
+    def _on_frame_label_resized(self):
+        """Rescale the shown frame to the operator label's new size"""
+        # A pending redraw will pick up the new size by itself
+        if not self._dirty and self._last_frame is not None:
+            self._on_frame_updated(self._last_frame)
+    
     def update_cross_position(self, scene_pos):
         """
         Update the cross position when user clicks on the image.
@@ -170,65 +262,120 @@ class AppView(QWidget):
     
     def update_robot_status(self, message):
         """Update the robot status label"""
-        self.robot_status.setText(f"Robot: {message}")
+        self._set_status_text(self.robot_status, f"Robot: {message}")
     
     def update_status_message(self, message):
         """Update general status from controller status messages"""
-        self.general_status.setText(f"General: {message}")
+        self._set_status_text(self.general_status, f"General: {message}")
     
     def update_state_mode(self, state, mode):
         """Update state and mode labels"""
-        self.state_mode_label.setText(f"State: {state} | Mode: {mode}")
+        texts = self._state_mode_texts.get((state, mode))
+        if texts is None:
+            texts = self._state_mode_texts[(state, mode)] = self._format_state_mode(state, mode)
+        self._set_status_text(self.state_mode_label, texts[0])
+        self._set_status_text(self.current_status, texts[1])
+    
+    def _format_state_mode(self, state, mode):
+        """Build the (state/mode, status) label texts for a state machine state"""
         # Update status based on state
         if state == "IDLE":
-            self.current_status.setText("Status: Ready")
-        elif state in ["INSERTING", "TESTING", "QUEUEING"]:
-            self.current_status.setText(f"Status: {state}")
+            status = "Status: Ready"
+        elif state in _BUSY_STATES:
+            status = f"Status: {state}"
         else:
-            self.current_status.setText(f"Status: {state}")
+            status = f"Status: {state}"
+        return f"State: {state} | Mode: {mode}", status
     
     def update_status_labels(self, status=None, state=None, mode=None, vision=None, general=None):
         """Update status labels"""
         if status:
-            self.current_status.setText(f"Status: {status}")
+            self._set_status_text(self.current_status, f"Status: {status}")
         if state and mode:
-            self.state_mode_label.setText(f"State: {state} | Mode: {mode}")
+            self._set_status_text(self.state_mode_label, f"State: {state} | Mode: {mode}")
         if vision:
-            self.vision_status.setText(f"Vision: {vision}")
+            self._set_status_text(self.vision_status, f"Vision: {vision}")
         if general:
-            self.general_status.setText(f"General: {general}")
+            self._set_status_text(self.general_status, f"General: {general}")
+    
+    def _set_status_text(self, label, text):
+        """Queue a status label's text; bursts of updates land in one relayout and repaint"""
+        self._pending_status[label] = text
+        if not self._status_timer.isActive():
+            self._status_timer.start()
+    
+    def _flush_status_labels(self):
+        """Apply the latest queued text to each status label"""
+        pending, self._pending_status = self._pending_status, {}
+        for label, text in pending.items():
+            label.setText(text)
 
     def keyPressEvent(self, event):
         """Handle keyboard events and pass to active tab if needed"""
+        key = event.key()
+        modifiers = event.modifiers()
+        
         # Force exit with Ctrl+Q
-        if event.key() == Qt.Key_Q and event.modifiers() & Qt.ControlModifier:
+        if key == Qt.Key_Q and modifiers & Qt.ControlModifier:
             logger.warning("Emergency application exit triggered with Ctrl+Q")
-            import os
             os._exit(0)  # Force quit the application
             
         # Only handle keys in Engineer tab (index 1)
         if self.tab_widget.currentIndex() == 1:  # Engineer tab
-            key = event.key()
-            # Check if shift is pressed
-            shift_pressed = event.modifiers() & Qt.ShiftModifier
-            
-            if key == Qt.Key_Left:
-                self.controller.shift_cross(dx=-0.5 if shift_pressed else -1)
-            elif key == Qt.Key_Right:
-                self.controller.shift_cross(dx=0.5 if shift_pressed else 1)
-            elif key == Qt.Key_Up:
-                self.controller.shift_cross(dy=-0.5 if shift_pressed else -1)
-            elif key == Qt.Key_Down:
-                self.controller.shift_cross(dy=0.5 if shift_pressed else 1)
-            elif key == Qt.Key_R:
-                self.controller.handle_r_key()
+            shift = self._ARROW_SHIFTS.get((key, bool(modifiers & Qt.ShiftModifier)))
+            if shift is not None:
+                self._queue_shift(*shift)
+                event.accept()
             else:
-                super().keyPressEvent(event)
+                # The keys below may read the cross position; apply arrow shifts still queued
+                # from this event batch first, so they see it where the user left it
+                if self._shift_flush_scheduled:
+                    self._flush_shift()
+                if key == Qt.Key_R:
+                    self.controller.handle_r_key()
+                else:
+                    super().keyPressEvent(event)
         else:
             super().keyPressEvent(event)
 
+    def _queue_shift(self, dx, dy):
+        """Accumulate an arrow-key shift; auto-repeats within one pass become a single move"""
+        self._pending_shift[0] += dx
+        self._pending_shift[1] += dy
+        if not self._shift_flush_scheduled:
+            self._shift_flush_scheduled = True
+            QTimer.singleShot(0, self._flush_shift)
+    
+    def _flush_shift(self):
+        """Send the accumulated arrow-key shift to the controller"""
+        self._shift_flush_scheduled = False
+        if self._closed:
+            return
+        dx, dy = self._pending_shift
+        self._pending_shift = [0, 0]
+        # shift_cross treats two non-zero values as absolute coordinates, so send each axis alone
+        if dx:
+            self.controller.shift_cross(dx=dx)
+        if dy:
+            self.controller.shift_cross(dy=dy)
+
+    def showEvent(self, event):
+        """Render the frame that arrived while the window was hidden"""
+        super().showEvent(event)
+        if self._dirty:
+            self._frame_timer.start(0)
+    
+    def changeEvent(self, event):
+        """Render the frame that arrived while the window was minimized"""
+        super().changeEvent(event)
+        if event.type() == QEvent.WindowStateChange and not self.isMinimized() and self._dirty:
+            self._frame_timer.start(0)
+
     def closeEvent(self, event):
         """Handle application closing"""
+        self._closed = True
+        self._frame_timer.stop()
+        self._status_timer.stop()
         self.controller.close()
         super().closeEvent(event)
 
@@ -239,10 +386,12 @@ class AppView(QWidget):
         
         # Update vision view behavior based on tab
         if index == 1:  # Engineer tab
+            self.display_stack.setCurrentWidget(self.vision_view)
             self.vision_view.set_pan_enabled(True)
             self.vision_view.set_zoom_enabled(True)
             self.vision_view.set_click_enabled(True)
         else:  # Operator tab
+            self.display_stack.setCurrentWidget(self.frame_label)
             self.vision_view.set_pan_enabled(False)
             self.vision_view.set_zoom_enabled(False)
             self.vision_view.set_click_enabled(False)
@@ -1,21 +1,40 @@
-from PyQt5.QtCore import Qt
+from PyQt5.QtCore import Qt, QSignalBlocker, QTimer, pyqtSlot
 from PyQt5.QtWidgets import (QPushButton, QVBoxLayout, 
                            QHBoxLayout, QWidget, 
-                           QSpinBox, QLabel, QGroupBox, QButtonGroup,
-                           QGraphicsView, QGraphicsScene, QTextEdit, QScrollArea,
-                           QGridLayout, QSlider)
-from PyQt5.QtGui import QImage, QPixmap, QFont, QColor, QPalette
+                           QLineEdit, QLabel, QGroupBox, QButtonGroup,
+                           QGraphicsView, QGraphicsScene, QGraphicsItem, QPlainTextEdit, QScrollArea,
+                           QSlider, QFrame)
+from PyQt5.QtGui import QImage, QPixmap, QFont, QPalette, QTextCursor, QIntValidator
+from collections import deque
+import numpy as np
+import yaml
 
 from utils.logger_config import get_logger
-from utils.ui_styles import (
-    group_box_primary, group_box_secondary, label_muted,
-    button_toggle_blue, button_toggle_green, button_toggle_green_speed,
-    button_action, button_save, button_capture, button_motor, button_move,
-    button_reconnect, text_edit_dark, ping_table_widget_style, spinbox_dark
-)
+from utils.ui_styles import get_status_palette
+from views.graphics_view import use_opengl_viewport
+from views.ping_bar import PingBarWidget
 
 logger = get_logger("EngineerView")
 
+# Pixmaps kept for recently shown frames: one per paused view state (orig, thres, contours)
+PIXMAP_CACHE_SIZE = 3
+
+# Speed names in speed_button_group id order
+SPEED_NAMES = ("slow", "normal", "fast")
+
+# Paused view states in frame_type_button_group id order
+FRAME_TYPE_STATES = ("paused orig", "paused thres", "paused contours")
+
+# Section ids in preload_button_group id order
+PRELOAD_SECTIONS = ("1", "2", "3")
+
+# Button object names, styled in build_global_qss
+_ACTION = "action"
+_TOGGLE_BLUE = "toggleBlue"
+_TOGGLE_GREEN = "toggleGreen"
+_TOGGLE_SPEED = "toggleGreenSpeed"
+
+
 class EngineerTabView(QWidget):
     """
     View component for the Engineer tab.
@@ -30,6 +49,8 @@ class EngineerTabView(QWidget):
         self.font_medium = font_medium
         self.font_normal = font_normal
         self.app_view = app_view  # Store reference to app_view for accessing vision_view
+        # Button and input fonts come from the global stylesheet (QWidget#engineerTab rules)
+        self.setObjectName("engineerTab")
         
         # Create additional fonts for better hierarchy
         self.font_large = QFont()
@@ -43,10 +64,109 @@ class EngineerTabView(QWidget):
         self.font_label.setPointSize(13)
         self.font_label.setBold(False)
         
-        self.setup_ui()
+        # Shared by the robot and camera "●" status lights
+        self.font_status_light = QFont("Arial", 18)
+        
+        # Scene, vision view and operator frame label will be set by app_view (shared display);
+        # holding them directly keeps per-frame and per-click lookups off app_view
+        self.scene = None
+        self.vision_view = None
+        self.frame_label = None
+        self.pixmap_item = None
+        self._scene_size = None
+        # Recently shown frames as (frame, operator label size or None for the scene, pixmap),
+        # newest first; the first entry is what is currently displayed
+        self._pixmap_cache = []
+        # (QImage format, bytes per line) per frame shape
+        self._qimage_layouts = {}
+        # Last previewed camera frame and its pixmap
+        self._preview_frame = None
+        self._preview_pixmap = None
+        # Captured image view, built on first preview (see _ensure_secondary_view)
+        self.secondary_view = None
+        self.secondary_scene = None
+        self._secondary_item = None
+        self._secondary_fit = None  # (image size, viewport size) of the last fitInView
+        # Get max_history from controller if available, otherwise default
+        self.max_history = getattr(self.controller, 'max_history', 20) if hasattr(self.controller, 'max_history') else 20
+        self.click_history = deque(maxlen=self.max_history)  # Oldest entries drop off automatically
+        # Position updates are applied at most ~30 times a second (see update_position_info)
+        self._pending_positions = []
+        self._position_timer = QTimer(self)
+        self._position_timer.setSingleShot(True)
+        self._position_timer.setInterval(33)
+        self._position_timer.timeout.connect(self._apply_position_update)
+        # Slider values reach the camera/vision (and config.yml) at most every 50 ms while
+        # dragging; the labels still follow every step (see on_exposure_time_changed)
+        self._pending_exposure = None
+        self._pending_threshold = None
+        self._slider_timer = QTimer(self)
+        self._slider_timer.setSingleShot(True)
+        self._slider_timer.setInterval(50)
+        self._slider_timer.timeout.connect(self._apply_slider_values)
+        # Set when clicks were recorded while the tab was hidden; the box is refilled on show
+        self._history_stale = False
+        
+        # Last robot/camera connection state shown (None until the first report)
+        self._robot_connected = None
+        self._camera_connected = None
+        
+        # Ping light colors: queued by _on_ping_status_changed, applied by _flush_ping_updates
+        self._pending_ping = {}
+        self._ping_timer = QTimer(self)
+        self._ping_timer.setSingleShot(True)
+        self._ping_timer.setInterval(80)
+        self._ping_timer.timeout.connect(self._flush_ping_updates)
+        
+        # The widgets are built on first show (see showEvent); the Operator tab is the startup tab.
+        # Network monitoring only runs while this tab is shown, the only place pings are displayed
+        self._built = False
         
         # Initialize with proper state
         self.view_state_changed("paused orig")
+    
+    def _make_button(self, text, slot=None, style=_ACTION, checkable=False, checked=False,
+                     min_w=None, min_h=38, group=None, gid=-1):
+        """
+        Create a push button styled by object name; font and colors come from the stylesheet.
+        With a group, the button is added to it under id gid (buttons in a group are usually
+        dispatched through the group's idClicked rather than a slot).
+        """
+        btn = QPushButton(text)
+        btn.setObjectName(style)
+        btn.setMinimumHeight(min_h)
+        if min_w is not None:
+            btn.setMinimumWidth(min_w)
+        if checkable:
+            btn.setCheckable(True)
+            btn.setChecked(checked)
+        if slot is not None:
+            btn.clicked.connect(slot)
+        if group is not None:
+            group.addButton(btn, gid)
+        return btn
+    
+    def showEvent(self, event):
+        """Build the tab's widgets the first time it is shown, and resume network monitoring"""
+        if not self._built:
+            self._built = True
+            self.setup_ui()
+        elif self._history_stale:
+            self._fill_history()
+        self._history_stale = False
+        # Ping colors that arrived while hidden
+        if self._pending_ping and not self._ping_timer.isActive():
+            self._ping_timer.start()
+        # Pings once right away, then periodically; statuses that changed meanwhile are emitted
+        if hasattr(self.controller, 'network_monitor'):
+            self.controller.start_network_monitoring()
+        super().showEvent(event)
+    
+    def hideEvent(self, event):
+        """Stop network monitoring while the tab is hidden"""
+        if hasattr(self.controller, 'network_monitor'):
+            self.controller.stop_network_monitoring()
+        super().hideEvent(event)
         
     def setup_ui(self):
         """Initialize the engineer tab interface."""
@@ -65,7 +185,7 @@ class EngineerTabView(QWidget):
         # Frame view controls
         frame_group = QGroupBox("📷 Frame View Controls")
         frame_group.setFont(self.font_large)
-        frame_group.setStyleSheet(group_box_primary('#4A9EFF'))
+        frame_group.setObjectName("groupBlue")
         frame_layout = QVBoxLayout()
         frame_layout.setSpacing(12)
         
@@ -73,42 +193,28 @@ class EngineerTabView(QWidget):
         frame_type_label_row = QHBoxLayout()
         frame_type_label = QLabel("Frame Type:")
         frame_type_label.setFont(self.font_label)
-        frame_type_label.setStyleSheet(label_muted())
+        frame_type_label.setObjectName("muted")
         frame_type_label_row.addWidget(frame_type_label)
         frame_type_label_row.addStretch()
         frame_layout.addLayout(frame_type_label_row)
         
         frame_type_button_row = QHBoxLayout()
         frame_type_button_row.setSpacing(10)
-        self.frame_type_button_group = QButtonGroup()
-        self.frame_type_original_btn = QPushButton("🖼️ Original")
-        self.frame_type_original_btn.setFont(self.font_normal)
-        self.frame_type_original_btn.setCheckable(True)
-        self.frame_type_original_btn.setChecked(True)
-        self.frame_type_original_btn.setMinimumHeight(38)
-        self.frame_type_original_btn.setMinimumWidth(110)
-        self.frame_type_original_btn.setStyleSheet(button_toggle_blue())
-        self.frame_type_original_btn.clicked.connect(lambda: self.on_frame_type_changed("paused orig"))
-        
-        self.frame_type_threshold_btn = QPushButton("🔲 Threshold")
-        self.frame_type_threshold_btn.setFont(self.font_normal)
-        self.frame_type_threshold_btn.setCheckable(True)
-        self.frame_type_threshold_btn.setMinimumHeight(38)
-        self.frame_type_threshold_btn.setMinimumWidth(110)
-        self.frame_type_threshold_btn.setStyleSheet(button_toggle_blue())
-        self.frame_type_threshold_btn.clicked.connect(lambda: self.on_frame_type_changed("paused thres"))
-        
-        self.frame_type_contours_btn = QPushButton("📐 Contours")
-        self.frame_type_contours_btn.setFont(self.font_normal)
-        self.frame_type_contours_btn.setCheckable(True)
-        self.frame_type_contours_btn.setMinimumHeight(38)
-        self.frame_type_contours_btn.setMinimumWidth(110)
-        self.frame_type_contours_btn.setStyleSheet(button_toggle_blue())
-        self.frame_type_contours_btn.clicked.connect(lambda: self.on_frame_type_changed("paused contours"))
-        
-        self.frame_type_button_group.addButton(self.frame_type_original_btn, 0)
-        self.frame_type_button_group.addButton(self.frame_type_threshold_btn, 1)
-        self.frame_type_button_group.addButton(self.frame_type_contours_btn, 2)
+        self.frame_type_button_group = QButtonGroup(self)
+        self.frame_type_original_btn = self._make_button(
+            "🖼️ Original", style=_TOGGLE_BLUE, checkable=True, checked=True, min_w=110,
+            group=self.frame_type_button_group, gid=0)
+        
+        self.frame_type_threshold_btn = self._make_button(
+            "🔲 Threshold", style=_TOGGLE_BLUE, checkable=True, min_w=110,
+            group=self.frame_type_button_group, gid=1)
+        
+        self.frame_type_contours_btn = self._make_button(
+            "📐 Contours", style=_TOGGLE_BLUE, checkable=True, min_w=110,
+            group=self.frame_type_button_group, gid=2)
+        
+        # One connection for the group; the button id indexes FRAME_TYPE_STATES
+        self.frame_type_button_group.idClicked.connect(self._on_frame_type_id_clicked)
         
         frame_type_button_row.addWidget(self.frame_type_original_btn)
         frame_type_button_row.addWidget(self.frame_type_threshold_btn)
@@ -120,30 +226,18 @@ class EngineerTabView(QWidget):
         centroids_label_row = QHBoxLayout()
         centroids_label = QLabel("Display Options:")
         centroids_label.setFont(self.font_label)
-        centroids_label.setStyleSheet(label_muted())
+        centroids_label.setObjectName("muted")
         centroids_label_row.addWidget(centroids_label)
         centroids_label_row.addStretch()
         frame_layout.addLayout(centroids_label_row)
         
         centroids_button_row = QHBoxLayout()
         centroids_button_row.setSpacing(10)
-        self.show_centroids_btn = QPushButton("📍 Centroids")
-        self.show_centroids_btn.setFont(self.font_normal)
-        self.show_centroids_btn.setCheckable(True)
-        self.show_centroids_btn.setChecked(True)
-        self.show_centroids_btn.setMinimumHeight(38)
-        self.show_centroids_btn.setMinimumWidth(130)
-        self.show_centroids_btn.setStyleSheet(button_toggle_green())
-        self.show_centroids_btn.clicked.connect(self.on_centroids_toggled)
-        
-        self.show_bbox_btn = QPushButton("📦 Bounding Boxes")
-        self.show_bbox_btn.setFont(self.font_normal)
-        self.show_bbox_btn.setCheckable(True)
-        self.show_bbox_btn.setChecked(True)
-        self.show_bbox_btn.setMinimumHeight(38)
-        self.show_bbox_btn.setMinimumWidth(150)
-        self.show_bbox_btn.setStyleSheet(button_toggle_green())
-        self.show_bbox_btn.clicked.connect(self.on_bbox_toggled)
+        self.show_centroids_btn = self._make_button(
+            "📍 Centroids", self.on_centroids_toggled, style=_TOGGLE_GREEN, checkable=True, checked=True, min_w=130)
+        
+        self.show_bbox_btn = self._make_button(
+            "📦 Bounding Boxes", self.on_bbox_toggled, style=_TOGGLE_GREEN, checkable=True, checked=True, min_w=150)
         
         centroids_button_row.addWidget(self.show_centroids_btn)
         centroids_button_row.addWidget(self.show_bbox_btn)
@@ -154,33 +248,18 @@ class EngineerTabView(QWidget):
         zoom_label_row = QHBoxLayout()
         zoom_label = QLabel("View Controls:")
         zoom_label.setFont(self.font_label)
-        zoom_label.setStyleSheet(label_muted())
+        zoom_label.setObjectName("muted")
         zoom_label_row.addWidget(zoom_label)
         zoom_label_row.addStretch()
         frame_layout.addLayout(zoom_label_row)
         
         zoom_button_row = QHBoxLayout()
         zoom_button_row.setSpacing(10)
-        self.zoom_in_button = QPushButton("🔍+ Zoom In")
-        self.zoom_in_button.setFont(self.font_normal)
-        self.zoom_in_button.setMinimumHeight(38)
-        self.zoom_in_button.setMinimumWidth(120)
-        self.zoom_in_button.setStyleSheet(button_action())
-        self.zoom_in_button.clicked.connect(self.on_zoom_in)
-        
-        self.zoom_out_button = QPushButton("🔍- Zoom Out")
-        self.zoom_out_button.setFont(self.font_normal)
-        self.zoom_out_button.setMinimumHeight(38)
-        self.zoom_out_button.setMinimumWidth(120)
-        self.zoom_out_button.setStyleSheet(button_action())
-        self.zoom_out_button.clicked.connect(self.on_zoom_out)
-        
-        self.reset_view_button = QPushButton("↺ Reset View")
-        self.reset_view_button.setFont(self.font_normal)
-        self.reset_view_button.setMinimumHeight(38)
-        self.reset_view_button.setMinimumWidth(120)
-        self.reset_view_button.setStyleSheet(button_action())
-        self.reset_view_button.clicked.connect(self.on_reset_view)
+        self.zoom_in_button = self._make_button("🔍+ Zoom In", self.on_zoom_in, min_w=120)
+        
+        self.zoom_out_button = self._make_button("🔍- Zoom Out", self.on_zoom_out, min_w=120)
+        
+        self.reset_view_button = self._make_button("↺ Reset View", self.on_reset_view, min_w=120)
         
         zoom_button_row.addWidget(self.zoom_in_button)
         zoom_button_row.addWidget(self.zoom_out_button)
@@ -192,19 +271,14 @@ class EngineerTabView(QWidget):
         save_label_row = QHBoxLayout()
         save_label = QLabel("Save:")
         save_label.setFont(self.font_label)
-        save_label.setStyleSheet(label_muted())
+        save_label.setObjectName("muted")
         save_label_row.addWidget(save_label)
         save_label_row.addStretch()
         frame_layout.addLayout(save_label_row)
         
         save_button_row = QHBoxLayout()
         save_button_row.setSpacing(10)
-        self.save_image_button = QPushButton("💾 Save Image")
-        self.save_image_button.setFont(self.font_normal)
-        self.save_image_button.setMinimumHeight(38)
-        self.save_image_button.setMinimumWidth(120)
-        self.save_image_button.setStyleSheet(button_save())
-        self.save_image_button.clicked.connect(self.controller.save_current_frame)
+        self.save_image_button = self._make_button("💾 Save Image", self.controller.save_current_frame, style="save", min_w=120)
         save_button_row.addWidget(self.save_image_button)
         save_button_row.addStretch()
         frame_layout.addLayout(save_button_row)
@@ -215,20 +289,18 @@ class EngineerTabView(QWidget):
         # Calibration tools
         calib_group = QGroupBox("🔧 Calibration Tools")
         calib_group.setFont(self.font_large)
-        calib_group.setStyleSheet(group_box_primary('#FFA500'))
+        calib_group.setObjectName("groupOrange")
         calib_layout = QVBoxLayout()
         calib_layout.setSpacing(12)
         
         # Enable/Disable sliders button
         enable_sliders_row = QHBoxLayout()
-        self.enable_sliders_btn = QPushButton("⚙️ Enable Sliders")
-        self.enable_sliders_btn.setFont(self.font_small)
-        self.enable_sliders_btn.setCheckable(True)
-        self.enable_sliders_btn.setChecked(False)  # Disabled by default
-        self.enable_sliders_btn.setMinimumHeight(28)
+        # Unchecked by default: sliders start disabled
+        self.enable_sliders_btn = self._make_button(
+            "⚙️ Enable Sliders", self.on_sliders_enable_toggled,
+            style=_TOGGLE_BLUE, checkable=True, min_h=28)
+        self.enable_sliders_btn.setProperty("compact", True)  # Smaller font, see build_global_qss
         self.enable_sliders_btn.setMaximumWidth(150)
-        self.enable_sliders_btn.setStyleSheet(button_toggle_blue())
-        self.enable_sliders_btn.clicked.connect(self.on_sliders_enable_toggled)
         enable_sliders_row.addWidget(self.enable_sliders_btn)
         enable_sliders_row.addStretch()
         calib_layout.addLayout(enable_sliders_row)
@@ -237,12 +309,12 @@ class EngineerTabView(QWidget):
         exposure_label_row = QHBoxLayout()
         exposure_label = QLabel("Exposure Time:")
         exposure_label.setFont(self.font_label)
-        exposure_label.setStyleSheet(label_muted())
+        exposure_label.setObjectName("muted")
         exposure_label_row.addWidget(exposure_label)
         
         self.exposure_value_label = QLabel("---")
         self.exposure_value_label.setFont(self.font_label)
-        self.exposure_value_label.setStyleSheet(label_muted())
+        self.exposure_value_label.setObjectName("muted")
         self.exposure_value_label.setMinimumWidth(80)
         exposure_label_row.addWidget(self.exposure_value_label)
         exposure_label_row.addStretch()
@@ -252,6 +324,8 @@ class EngineerTabView(QWidget):
         self.exposure_slider = QSlider(Qt.Horizontal)
         self.exposure_slider.setMinimum(100)  # 100 µs
         self.exposure_slider.setMaximum(300000)  # 300 ms
+        self.exposure_slider.setSingleStep(100)  # Arrow keys: 0.1 ms
+        self.exposure_slider.setPageStep(5000)  # Page keys: 5 ms
         self.exposure_slider.setMinimumHeight(30)
         self.exposure_slider.valueChanged.connect(self.on_exposure_time_changed)
         exposure_slider_row.addWidget(self.exposure_slider)
@@ -264,12 +338,12 @@ class EngineerTabView(QWidget):
         threshold_label_row = QHBoxLayout()
         threshold_label = QLabel("Threshold:")
         threshold_label.setFont(self.font_label)
-        threshold_label.setStyleSheet(label_muted())
+        threshold_label.setObjectName("muted")
         threshold_label_row.addWidget(threshold_label)
         
         self.threshold_value_label = QLabel("---")
         self.threshold_value_label.setFont(self.font_label)
-        self.threshold_value_label.setStyleSheet(label_muted())
+        self.threshold_value_label.setObjectName("muted")
         self.threshold_value_label.setMinimumWidth(80)
         threshold_label_row.addWidget(self.threshold_value_label)
         threshold_label_row.addStretch()
@@ -293,20 +367,12 @@ class EngineerTabView(QWidget):
         # Preview / capture buttons
         capture_button_row = QHBoxLayout()
         capture_button_row.setSpacing(10)
-        self.preview_button = QPushButton("👁️ Preview")
-        self.preview_button.setFont(self.font_normal)
-        self.preview_button.setMinimumHeight(38)
-        self.preview_button.setMinimumWidth(120)
-        self.preview_button.setStyleSheet(button_action())
-        self.preview_button.clicked.connect(self.on_preview_image)
+        self.preview_button = self._make_button("👁️ Preview", self.on_preview_image, min_w=120)
+        if hasattr(self.controller, 'preview_frame_ready'):
+            self.controller.preview_frame_ready.connect(self._on_preview_frame_ready)
         capture_button_row.addWidget(self.preview_button)
 
-        self.capture_image_button = QPushButton("📸 Capture Image")
-        self.capture_image_button.setFont(self.font_normal)
-        self.capture_image_button.setMinimumHeight(38)
-        self.capture_image_button.setMinimumWidth(150)
-        self.capture_image_button.setStyleSheet(button_capture())
-        self.capture_image_button.clicked.connect(self.on_capture_image)
+        self.capture_image_button = self._make_button("📸 Capture Image", self.on_capture_image, style="capture", min_w=150)
         capture_button_row.addWidget(self.capture_image_button)
         capture_button_row.addStretch()
         calib_layout.addLayout(capture_button_row)
@@ -314,14 +380,17 @@ class EngineerTabView(QWidget):
         # Secondary frame for captured image
         secondary_frame_group = QGroupBox("Captured Image")
         secondary_frame_group.setFont(self.font_label)
-        secondary_frame_group.setStyleSheet(group_box_secondary())
-        secondary_frame_layout = QVBoxLayout()
-        self.secondary_view = QGraphicsView()
-        self.secondary_scene = QGraphicsScene()
-        self.secondary_view.setScene(self.secondary_scene)
-        self.secondary_view.setMinimumHeight(150)
-        secondary_frame_layout.addWidget(self.secondary_view)
-        secondary_frame_group.setLayout(secondary_frame_layout)
+        secondary_frame_group.setObjectName("groupSecondary")
+        self._secondary_frame_layout = QVBoxLayout()
+        # Most sessions never preview, so the view (and its OpenGL viewport) is built on the
+        # first preview by _ensure_secondary_view; until then an empty frame holds its place
+        self._secondary_placeholder = QFrame()
+        self._secondary_placeholder.setFrameStyle(QFrame.StyledPanel | QFrame.Sunken)
+        self._secondary_placeholder.setBackgroundRole(QPalette.Base)
+        self._secondary_placeholder.setAutoFillBackground(True)
+        self._secondary_placeholder.setMinimumHeight(150)
+        self._secondary_frame_layout.addWidget(self._secondary_placeholder)
+        secondary_frame_group.setLayout(self._secondary_frame_layout)
         calib_layout.addWidget(secondary_frame_group)
         
         calib_group.setLayout(calib_layout)
@@ -330,24 +399,20 @@ class EngineerTabView(QWidget):
         # Robot motor control
         motor_group = QGroupBox("⚙️ Robot Motor Control")
         motor_group.setFont(self.font_large)
-        motor_group.setStyleSheet(group_box_primary('#FF6B6B'))
+        motor_group.setObjectName("groupRed")
         motor_layout = QVBoxLayout()
         motor_layout.setSpacing(12)
         
         # Motor toggle button
-        self.motor_toggle_btn = QPushButton()
-        self.motor_toggle_btn.setFont(self.font_normal)
-        self.motor_toggle_btn.setCheckable(True)
-        self.motor_toggle_btn.setMinimumHeight(45)
-        self.motor_toggle_btn.setStyleSheet(button_motor())
-        self.motor_toggle_btn.clicked.connect(self.on_motor_toggle_clicked)
+        self.motor_toggle_btn = self._make_button(
+            "", self.on_motor_toggle_clicked, style="motor", checkable=True, min_h=45)
         motor_layout.addWidget(self.motor_toggle_btn)
         
         # Speed control - label row
         speed_label_row = QHBoxLayout()
         speed_label = QLabel("Speed:")
         speed_label.setFont(self.font_label)
-        speed_label.setStyleSheet(label_muted())
+        speed_label.setObjectName("muted")
         speed_label_row.addWidget(speed_label)
         speed_label_row.addStretch()
         motor_layout.addLayout(speed_label_row)
@@ -355,36 +420,22 @@ class EngineerTabView(QWidget):
         # Speed control - button row
         speed_button_row = QHBoxLayout()
         speed_button_row.setSpacing(10)
-        self.speed_button_group = QButtonGroup()
-        
-        self.speed_slow_button = QPushButton("🐌 Slow")
-        self.speed_slow_button.setFont(self.font_normal)
-        self.speed_slow_button.setCheckable(True)
-        self.speed_slow_button.setMinimumHeight(38)
-        self.speed_slow_button.setMinimumWidth(100)
-        self.speed_slow_button.setStyleSheet(button_toggle_green_speed())
-        self.speed_slow_button.clicked.connect(lambda: self.on_speed_selected("slow"))
-        
-        self.speed_normal_button = QPushButton("⚡ Normal")
-        self.speed_normal_button.setFont(self.font_normal)
-        self.speed_normal_button.setCheckable(True)
-        self.speed_normal_button.setChecked(True)  # Default selection
-        self.speed_normal_button.setMinimumHeight(38)
-        self.speed_normal_button.setMinimumWidth(100)
-        self.speed_normal_button.setStyleSheet(button_toggle_green_speed())
-        self.speed_normal_button.clicked.connect(lambda: self.on_speed_selected("normal"))
-        
-        self.speed_fast_button = QPushButton("🚀 Fast")
-        self.speed_fast_button.setFont(self.font_normal)
-        self.speed_fast_button.setCheckable(True)
-        self.speed_fast_button.setMinimumHeight(38)
-        self.speed_fast_button.setMinimumWidth(100)
-        self.speed_fast_button.setStyleSheet(button_toggle_green_speed())
-        self.speed_fast_button.clicked.connect(lambda: self.on_speed_selected("fast"))
-        
-        self.speed_button_group.addButton(self.speed_slow_button, 0)
-        self.speed_button_group.addButton(self.speed_normal_button, 1)
-        self.speed_button_group.addButton(self.speed_fast_button, 2)
+        self.speed_button_group = QButtonGroup(self)
+        
+        self.speed_slow_button = self._make_button(
+            "🐌 Slow", style=_TOGGLE_SPEED, checkable=True, min_w=100,
+            group=self.speed_button_group, gid=0)
+        
+        self.speed_normal_button = self._make_button(  # Default selection
+            "⚡ Normal", style=_TOGGLE_SPEED, checkable=True, checked=True, min_w=100,
+            group=self.speed_button_group, gid=1)
+        
+        self.speed_fast_button = self._make_button(
+            "🚀 Fast", style=_TOGGLE_SPEED, checkable=True, min_w=100,
+            group=self.speed_button_group, gid=2)
+        
+        # One connection for the whole group; the button id indexes SPEED_NAMES
+        self.speed_button_group.idClicked.connect(self._on_speed_id_clicked)
         
         speed_button_row.addWidget(self.speed_slow_button)
         speed_button_row.addWidget(self.speed_normal_button)
@@ -402,15 +453,15 @@ class EngineerTabView(QWidget):
         # Click history
         history_group = QGroupBox("📋 Click History")
         history_group.setFont(self.font_label)
-        history_group.setStyleSheet(group_box_secondary())
+        history_group.setObjectName("groupSecondary")
         history_layout = QVBoxLayout()
-        self.history_text = QTextEdit()
+        self.history_text = QPlainTextEdit()
         self.history_text.setFont(self.font_small)
         self.history_text.setReadOnly(False)
         self.history_text.setMinimumHeight(150)
         self.history_text.setMaximumHeight(200)
         self.history_text.setPlaceholderText("Click history will appear here...")
-        self.history_text.setStyleSheet(text_edit_dark())
+        self.history_text.setObjectName("history")
         history_layout.addWidget(self.history_text)
         history_group.setLayout(history_layout)
         calib_layout.addWidget(history_group)
@@ -418,109 +469,50 @@ class EngineerTabView(QWidget):
         # Robot move controls
         move_group = QGroupBox("🤖 Robot Move to Point")
         move_group.setFont(self.font_large)
-        move_group.setStyleSheet(group_box_primary('#9B59B6'))
+        move_group.setObjectName("groupPurple")
         move_layout = QVBoxLayout()
         move_layout.setSpacing(12)
         
-        # First row: X and Y
-        coord_row1 = QHBoxLayout()
-        coord_row1.setSpacing(8)
-        
-        x_label = QLabel("X:")
-        x_label.setFont(self.font_label)
-        x_label.setStyleSheet(label_muted() + " min-width: 30px;")
-        coord_row1.addWidget(x_label)
-        self.x_spinbox = QSpinBox()
-        self.x_spinbox.setFont(self.font_normal)
-        self.x_spinbox.setRange(-10000, 10000)
-        self.x_spinbox.setValue(0)
-        self.x_spinbox.setMinimumHeight(38)
-        self.x_spinbox.setStyleSheet(spinbox_dark())
-        coord_row1.addWidget(self.x_spinbox)
-        
-        y_label = QLabel("Y:")
-        y_label.setFont(self.font_label)
-        y_label.setStyleSheet(label_muted() + " min-width: 30px;")
-        coord_row1.addWidget(y_label)
-        self.y_spinbox = QSpinBox()
-        self.y_spinbox.setFont(self.font_normal)
-        self.y_spinbox.setRange(-10000, 10000)
-        self.y_spinbox.setValue(0)
-        self.y_spinbox.setMinimumHeight(38)
-        self.y_spinbox.setStyleSheet(spinbox_dark())
-        coord_row1.addWidget(self.y_spinbox)
-        coord_row1.addStretch()
-        move_layout.addLayout(coord_row1)
-        
-        # Second row: Z and U
-        coord_row2 = QHBoxLayout()
-        coord_row2.setSpacing(8)
-        
-        z_label = QLabel("Z:")
-        z_label.setFont(self.font_label)
-        z_label.setStyleSheet(label_muted() + " min-width: 30px;")
-        coord_row2.addWidget(z_label)
-        self.z_spinbox = QSpinBox()
-        self.z_spinbox.setFont(self.font_normal)
-        self.z_spinbox.setRange(-10000, 10000)
-        self.z_spinbox.setValue(0)
-        self.z_spinbox.setMinimumHeight(38)
-        self.z_spinbox.setStyleSheet(spinbox_dark())
-        coord_row2.addWidget(self.z_spinbox)
-        
-        u_label = QLabel("U:")
-        u_label.setFont(self.font_label)
-        u_label.setStyleSheet(label_muted() + " min-width: 30px;")
-        coord_row2.addWidget(u_label)
-        self.u_spinbox = QSpinBox()
-        self.u_spinbox.setFont(self.font_normal)
-        self.u_spinbox.setRange(-10000, 10000)
-        self.u_spinbox.setValue(0)
-        self.u_spinbox.setMinimumHeight(38)
-        self.u_spinbox.setStyleSheet(spinbox_dark())
-        coord_row2.addWidget(self.u_spinbox)
-        coord_row2.addStretch()
-        move_layout.addLayout(coord_row2)
+        # Coordinate fields are plain line edits sharing one integer validator
+        # (no spin buttons needed; values are typed or preloaded from a section)
+        coord_validator = QIntValidator(-10000, 10000, self)
+        
+        # Two rows, X/Y then Z/U; each field is stored as self.<axis>_edit
+        for row_axes in (("x", "y"), ("z", "u")):
+            coord_row = QHBoxLayout()
+            coord_row.setSpacing(8)
+            for axis in row_axes:
+                coord_label = QLabel(f"{axis.upper()}:")
+                coord_label.setFont(self.font_label)
+                coord_label.setObjectName("coordLabel")
+                coord_row.addWidget(coord_label)
+                coord_edit = QLineEdit("0")
+                coord_edit.setValidator(coord_validator)
+                coord_edit.setMinimumHeight(38)
+                coord_edit.setObjectName("coord")
+                coord_row.addWidget(coord_edit)
+                setattr(self, f"{axis}_edit", coord_edit)
+            coord_row.addStretch()
+            move_layout.addLayout(coord_row)
         
         # Preload buttons row
         preload_button_row = QHBoxLayout()
         preload_button_row.setSpacing(10)
+        self.preload_button_group = QButtonGroup(self)
+        self.preload_button_group.setExclusive(False)
         
-        # Button for section 1
-        self.preload_section1_btn = QPushButton("📍 Section 1")
-        self.preload_section1_btn.setFont(self.font_normal)
-        self.preload_section1_btn.setMinimumHeight(38)
-        self.preload_section1_btn.setMinimumWidth(100)
-        self.preload_section1_btn.setStyleSheet(button_action())
-        self.preload_section1_btn.clicked.connect(lambda: self._preload_section("1"))
-        preload_button_row.addWidget(self.preload_section1_btn)
-        
-        # Button for section 2
-        self.preload_section2_btn = QPushButton("📍 Section 2")
-        self.preload_section2_btn.setFont(self.font_normal)
-        self.preload_section2_btn.setMinimumHeight(38)
-        self.preload_section2_btn.setMinimumWidth(100)
-        self.preload_section2_btn.setStyleSheet(button_action())
-        self.preload_section2_btn.clicked.connect(lambda: self._preload_section("2"))
-        preload_button_row.addWidget(self.preload_section2_btn)
-        
-        # Button for section 3
-        self.preload_section3_btn = QPushButton("📍 Section 3")
-        self.preload_section3_btn.setFont(self.font_normal)
-        self.preload_section3_btn.setMinimumHeight(38)
-        self.preload_section3_btn.setMinimumWidth(100)
-        self.preload_section3_btn.setStyleSheet(button_action())
-        self.preload_section3_btn.clicked.connect(lambda: self._preload_section("3"))
-        preload_button_row.addWidget(self.preload_section3_btn)
+        # Plain push buttons grouped only to share one connection; the id indexes PRELOAD_SECTIONS
+        for gid, section in enumerate(PRELOAD_SECTIONS):
+            btn = self._make_button(
+                f"📍 Section {section}", min_w=100, group=self.preload_button_group, gid=gid)
+            setattr(self, f"preload_section{section}_btn", btn)
+            preload_button_row.addWidget(btn)
+        self.preload_button_group.idClicked.connect(self._on_preload_id_clicked)
         
         preload_button_row.addStretch()
         move_layout.addLayout(preload_button_row)
         
-        self.move_button = QPushButton("▶️ Move Robot")
-        self.move_button.setFont(self.font_normal)
-        self.move_button.setMinimumHeight(42)
-        self.move_button.setStyleSheet(button_move())
-        self.move_button.clicked.connect(self.on_move_robot)
+        self.move_button = self._make_button("▶️ Move Robot", self.on_move_robot, style="move", min_h=42)
         move_layout.addWidget(self.move_button)
         
         move_group.setLayout(move_layout)
@@ -531,73 +523,40 @@ class EngineerTabView(QWidget):
         # Connection group (at the bottom)
         connect_group = QGroupBox("🔌 Connection Status")
         connect_group.setFont(self.font_large)
-        connect_group.setStyleSheet(group_box_primary('#00CED1'))
+        connect_group.setObjectName("groupCyan")
         connect_layout = QVBoxLayout()
         connect_layout.setSpacing(12)
         
-        # Ping table: labels row and status lights row
+        # Ping table: one column per monitored device
         devices = {}
         if hasattr(self.controller, 'get_network_devices'):
             devices = self.controller.get_network_devices()
         else:
             logger.warning("Controller missing get_network_devices method")
         
-        ping_table_widget = QWidget()
-        ping_table = QGridLayout(ping_table_widget)
-        ping_table.setSpacing(15)
-        ping_table.setContentsMargins(10, 10, 10, 10)
-        
-        # Add border styling
-        ping_table_widget.setStyleSheet(ping_table_widget_style())
-        
-        # Row 0: Device labels
-        col = 0
-        self.ping_labels = {}
-        for ip, name in devices.items():
-            label = QLabel(name)
-            label.setFont(self.font_label)
-            label.setAlignment(Qt.AlignCenter)
-            label.setStyleSheet(label_muted() + " font-weight: bold;")
-            ping_table.addWidget(label, 0, col)
-            col += 1
-        
-        # Row 1: Status lights
-        col = 0
-        for ip in devices.keys():
-            status_light = QLabel("●")
-            status_light.setFont(QFont("Arial", 16))
-            status_light.setAlignment(Qt.AlignCenter)
-            status_light.setMinimumWidth(25)
-            status_light.setStyleSheet("color: gray;")
-            self.ping_labels[ip] = status_light
-            ping_table.addWidget(status_light, 1, col)
-            col += 1
-        
-        connect_layout.addWidget(ping_table_widget)
+        # One painted widget for all device names and status dots
+        self.ping_bar = PingBarWidget(devices, self.font_label)
+        self.ping_bar.setObjectName("pingTable")
+        connect_layout.addWidget(self.ping_bar)
         
         # Robot reconnect row
         robot_row = QHBoxLayout()
         robot_row.setSpacing(12)
         robot_label = QLabel("Robot:")
         robot_label.setFont(self.font_label)
-        robot_label.setStyleSheet(label_muted())
+        robot_label.setObjectName("muted")
         robot_row.addWidget(robot_label)
         
         self.robot_status_light = QLabel("●")
-        self.robot_status_light.setFont(QFont("Arial", 18))
+        self.robot_status_light.setFont(self.font_status_light)
         self.robot_status_light.setAlignment(Qt.AlignCenter)
         self.robot_status_light.setMinimumWidth(25)
-        self.robot_status_light.setStyleSheet("color: gray;")
+        self.robot_status_light.setPalette(get_status_palette("gray"))
         robot_row.addWidget(self.robot_status_light)
         
         robot_row.addStretch()
         
-        self.robot_reconnect_btn = QPushButton("🔄 Reconnect")
-        self.robot_reconnect_btn.setFont(self.font_normal)
-        self.robot_reconnect_btn.setMinimumHeight(35)
-        self.robot_reconnect_btn.setMinimumWidth(120)
-        self.robot_reconnect_btn.setStyleSheet(button_reconnect())
-        self.robot_reconnect_btn.clicked.connect(self.on_robot_reconnect)
+        self.robot_reconnect_btn = self._make_button("🔄 Reconnect", self.on_robot_reconnect, style="reconnect", min_w=120, min_h=35)
         robot_row.addWidget(self.robot_reconnect_btn)
         
         connect_layout.addLayout(robot_row)
@@ -607,24 +566,19 @@ class EngineerTabView(QWidget):
         camera_row.setSpacing(12)
         camera_label = QLabel("Camera:")
         camera_label.setFont(self.font_label)
-        camera_label.setStyleSheet(label_muted())
+        camera_label.setObjectName("muted")
         camera_row.addWidget(camera_label)
         
         self.camera_status_light = QLabel("●")
-        self.camera_status_light.setFont(QFont("Arial", 18))
+        self.camera_status_light.setFont(self.font_status_light)
         self.camera_status_light.setAlignment(Qt.AlignCenter)
         self.camera_status_light.setMinimumWidth(25)
-        self.camera_status_light.setStyleSheet("color: gray;")
+        self.camera_status_light.setPalette(get_status_palette("gray"))
         camera_row.addWidget(self.camera_status_light)
         
         camera_row.addStretch()
         
-        self.camera_reconnect_btn = QPushButton("🔄 Reconnect")
-        self.camera_reconnect_btn.setFont(self.font_normal)
-        self.camera_reconnect_btn.setMinimumHeight(35)
-        self.camera_reconnect_btn.setMinimumWidth(120)
-        self.camera_reconnect_btn.setStyleSheet(button_reconnect())
-        self.camera_reconnect_btn.clicked.connect(self.on_camera_reconnect)
+        self.camera_reconnect_btn = self._make_button("🔄 Reconnect", self.on_camera_reconnect, style="reconnect", min_w=120, min_h=35)
         camera_row.addWidget(self.camera_reconnect_btn)
         
         connect_layout.addLayout(camera_row)
@@ -640,27 +594,25 @@ class EngineerTabView(QWidget):
         main_layout.setContentsMargins(0, 0, 0, 0)
         main_layout.addWidget(scroll_area)
         
-        # Scene will be set by app_view (shared scene)
-        self.scene = None
-        self.pixmap_item = None
-        self.click_history = []
-        # Get max_history from controller if available, otherwise default
-        self.max_history = getattr(self.controller, 'max_history', 20) if hasattr(self.controller, 'max_history') else 20
+        # Clicks recorded before the tab was built
+        self._fill_history()
         
         # Setup network monitoring
         self._setup_network_monitoring()
     
+    @pyqtSlot(int)
+    def _on_frame_type_id_clicked(self, button_id):
+        """Map a frame type button id to its view state"""
+        self.on_frame_type_changed(FRAME_TYPE_STATES[button_id])
+    
     def on_frame_type_changed(self, state):
         """Handle frame type change"""
         self.view_state_changed(state)
-        # Update button states
-        if state == "paused orig":
-            self.frame_type_original_btn.setChecked(True)
-        elif state == "paused thres":
-            self.frame_type_threshold_btn.setChecked(True)
-        elif state == "paused contours":
-            self.frame_type_contours_btn.setChecked(True)
+        # The group is exclusive, so checking one button unchecks the others
+        if state in FRAME_TYPE_STATES:
+            self.frame_type_button_group.button(FRAME_TYPE_STATES.index(state)).setChecked(True)
     
+    @pyqtSlot()
     def on_centroids_toggled(self):
         """Handle centroids toggle"""
         enabled = self.show_centroids_btn.isChecked()
@@ -669,6 +621,7 @@ class EngineerTabView(QWidget):
         else:
             logger.warning("Controller missing set_show_centroids")
     
+    @pyqtSlot()
     def on_bbox_toggled(self):
         """Handle bounding boxes toggle"""
         enabled = self.show_bbox_btn.isChecked()
@@ -677,34 +630,27 @@ class EngineerTabView(QWidget):
         else:
             logger.warning("Controller missing set_show_bounding_boxes")
     
+    @pyqtSlot()
     def on_zoom_in(self):
         """Handle zoom in button"""
-        if self.app_view and hasattr(self.app_view, 'vision_view'):
-            vision_view = self.app_view.vision_view
-            if vision_view.enable_zoom:
-                vision_view.scale(1.2, 1.2)
-                vision_view.scale_factor *= 1.2
+        if self.vision_view is not None:
+            self.vision_view.queue_zoom(1.2)
     
+    @pyqtSlot()
     def on_zoom_out(self):
         """Handle zoom out button"""
-        if self.app_view and hasattr(self.app_view, 'vision_view'):
-            vision_view = self.app_view.vision_view
-            if vision_view.enable_zoom:
-                if vision_view.scale_factor > vision_view.min_scale:
-                    vision_view.scale(1/1.2, 1/1.2)
-                    vision_view.scale_factor /= 1.2
-                    vision_view.scale_factor = max(vision_view.scale_factor, vision_view.min_scale)
+        if self.vision_view is not None:
+            self.vision_view.queue_zoom(1 / 1.2)
     
+    @pyqtSlot()
     def on_reset_view(self):
         """Handle reset view button"""
-        if self.app_view and hasattr(self.app_view, 'vision_view'):
-            vision_view = self.app_view.vision_view
-            vision_view.reset_view()
+        if self.vision_view is not None:
+            self.vision_view.reset_view()
     
     def _update_exposure_time_from_config(self):
         """Update exposure time slider and label from config"""
         try:
-            import yaml
             with open('config.yml', 'r') as file:
                 config_data = yaml.safe_load(file)
             
@@ -713,9 +659,8 @@ class EngineerTabView(QWidget):
             # Clamp value to slider range
             exposure_time = max(self.exposure_slider.minimum(), 
                               min(self.exposure_slider.maximum(), int(exposure_time)))
-            self.exposure_slider.blockSignals(True)
-            self.exposure_slider.setValue(int(exposure_time))
-            self.exposure_slider.blockSignals(False)
+            with QSignalBlocker(self.exposure_slider):
+                self.exposure_slider.setValue(int(exposure_time))
             # Display in milliseconds
             exposure_ms = exposure_time / 1000.0
             self.exposure_value_label.setText(f"{exposure_ms:.2f} ms")
@@ -723,9 +668,8 @@ class EngineerTabView(QWidget):
             logger.error(f"Error updating exposure time from config: {e}")
             # Set default on error
             default_value = 5000
-            self.exposure_slider.blockSignals(True)
-            self.exposure_slider.setValue(default_value)
-            self.exposure_slider.blockSignals(False)
+            with QSignalBlocker(self.exposure_slider):
+                self.exposure_slider.setValue(default_value)
             self.exposure_value_label.setText(f"{default_value / 1000.0:.2f} ms")
     
     def _update_threshold_from_config(self):
@@ -736,9 +680,8 @@ class EngineerTabView(QWidget):
                 threshold = self.controller.get_threshold()
             
             if threshold >= 0:
-                self.threshold_slider.blockSignals(True)
-                self.threshold_slider.setValue(threshold)
-                self.threshold_slider.blockSignals(False)
+                with QSignalBlocker(self.threshold_slider):
+                    self.threshold_slider.setValue(threshold)
                 if threshold == 0:
                     self.threshold_value_label.setText("Otsu (auto)")
                 else:
@@ -746,36 +689,30 @@ class EngineerTabView(QWidget):
             else:
                 # Default threshold from config
                 default_value = 135
-                self.threshold_slider.blockSignals(True)
-                self.threshold_slider.setValue(default_value)
-                self.threshold_slider.blockSignals(False)
+                with QSignalBlocker(self.threshold_slider):
+                    self.threshold_slider.setValue(default_value)
                 self.threshold_value_label.setText(str(default_value))
         except Exception as e:
             logger.error(f"Error updating threshold from config: {e}")
             # Set default on error
             default_value = 135
-            self.threshold_slider.blockSignals(True)
-            self.threshold_slider.setValue(default_value)
-            self.threshold_slider.blockSignals(False)
+            with QSignalBlocker(self.threshold_slider):
+                self.threshold_slider.setValue(default_value)
             self.threshold_value_label.setText(str(default_value))
     
+    @pyqtSlot(int)
     def on_threshold_changed(self, value):
-        """Handle threshold slider value change"""
-        try:
-            # Update label
-            if value == 0:
-                self.threshold_value_label.setText("Otsu (auto)")
-            else:
-                self.threshold_value_label.setText(str(value))
-            
-            # Set threshold value (this will also save to config)
-            if hasattr(self.controller, 'set_threshold'):
-                success = self.controller.set_threshold(value)
-                if not success:
-                    logger.warning(f"Failed to set threshold to {value}")
-        except Exception as e:
-            logger.error(f"Error setting threshold: {e}")
+        """Handle threshold slider value change; the value is applied by _apply_slider_values"""
+        # Update label
+        if value == 0:
+            self.threshold_value_label.setText("Otsu (auto)")
+        else:
+            self.threshold_value_label.setText(str(value))
+        self._pending_threshold = value
+        if not self._slider_timer.isActive():
+            self._slider_timer.start()
     
+    @pyqtSlot()
     def on_sliders_enable_toggled(self):
         """Handle enable/disable sliders button toggle"""
         enabled = self.enable_sliders_btn.isChecked()
@@ -786,63 +723,117 @@ class EngineerTabView(QWidget):
         """Update enabled state of exposure and threshold sliders"""
         self.exposure_slider.setEnabled(enabled)
         self.threshold_slider.setEnabled(enabled)
-        # Also update labels to show disabled state
-        if not enabled:
-            self.exposure_value_label.setStyleSheet(label_muted() + " color: gray;")
-            self.threshold_value_label.setStyleSheet(label_muted() + " color: gray;")
-        else:
-            self.exposure_value_label.setStyleSheet(label_muted())
-            self.threshold_value_label.setStyleSheet(label_muted())
+        # Also update labels to show disabled state (styled by QLabel#muted:disabled)
+        self.exposure_value_label.setEnabled(enabled)
+        self.threshold_value_label.setEnabled(enabled)
     
+    @pyqtSlot(int)
     def on_exposure_time_changed(self, value):
-        """Handle exposure time slider value change"""
-        try:
-            # Update label (display in milliseconds)
-            exposure_ms = value / 1000.0
-            self.exposure_value_label.setText(f"{exposure_ms:.2f} ms")
-            
-            # Set camera exposure time (this will also save to config)
-            if hasattr(self.controller, 'set_exposure_time'):
-                success = self.controller.set_exposure_time(float(value))
-                if not success:
-                    logger.warning(f"Failed to set exposure time to {value} µs")
-        except Exception as e:
-            logger.error(f"Error setting exposure time: {e}")
+        """Handle exposure time slider value change; the value is applied by _apply_slider_values"""
+        # Update label (display in milliseconds)
+        exposure_ms = value / 1000.0
+        self.exposure_value_label.setText(f"{exposure_ms:.2f} ms")
+        self._pending_exposure = value
+        if not self._slider_timer.isActive():
+            self._slider_timer.start()
+    
+    @pyqtSlot()
+    def _apply_slider_values(self):
+        """Send the latest exposure/threshold slider values; each set also saves to config"""
+        exposure, self._pending_exposure = self._pending_exposure, None
+        threshold, self._pending_threshold = self._pending_threshold, None
+        if exposure is not None:
+            try:
+                if hasattr(self.controller, 'set_exposure_time'):
+                    success = self.controller.set_exposure_time(float(exposure))
+                    if not success:
+                        logger.warning(f"Failed to set exposure time to {exposure} µs")
+            except Exception as e:
+                logger.error(f"Error setting exposure time: {e}")
+        if threshold is not None:
+            try:
+                if hasattr(self.controller, 'set_threshold'):
+                    success = self.controller.set_threshold(threshold)
+                    if not success:
+                        logger.warning(f"Failed to set threshold to {threshold}")
+            except Exception as e:
+                logger.error(f"Error setting threshold: {e}")
     
+    @pyqtSlot()
     def on_preview_image(self):
-        """Capture latest frame from camera and show in secondary frame"""
-        # Get latest frame from camera via controller
-        frame = None
+        """Request the latest camera frame; it is shown by _on_preview_frame_ready"""
+        if hasattr(self.controller, 'request_preview_frame'):
+            self.controller.request_preview_frame()
+        else:
+            logger.warning("Controller missing request_preview_frame method")
+    
+    @pyqtSlot(object)
+    def _on_preview_frame_ready(self, frame):
+        """Show a fetched camera frame in the secondary frame"""
         try:
-            if hasattr(self.controller, 'get_preview_frame'):
-                frame = self.controller.get_preview_frame()
-            
             if frame is None:
                 logger.warning("No frame available from camera")
                 return
             
-            # Make a copy to ensure data is contiguous and safe
-            import numpy as np
-            frame = np.ascontiguousarray(frame)
-            
-            # Convert numpy array to QPixmap (same logic as update_display)
-            if len(frame.shape) == 3:
-                h, w, c = frame.shape
-                qimg = QImage(frame.data, w, h, w * c, QImage.Format_RGB888)
+            # The controller falls back to the stored camera frame when the camera returns
+            # nothing, so repeated previews can hand back the same array; reuse its pixmap
+            if frame is self._preview_frame:
+                captured_pixmap = self._preview_pixmap
             else:
-                h, w = frame.shape
-                qimg = QImage(frame.data, w, h, w, QImage.Format_Grayscale8)
-            
-            captured_pixmap = QPixmap.fromImage(qimg)
+                captured_pixmap = self._frame_to_pixmap(frame)
+                # Holding the frame keeps its identity from being recycled by a new array
+                self._preview_frame = frame
+                self._preview_pixmap = captured_pixmap
             
-            # Display in secondary view
-            self.secondary_scene.clear()
-            self.secondary_scene.addPixmap(captured_pixmap)
-            self.secondary_view.fitInView(self.secondary_scene.itemsBoundingRect(), Qt.KeepAspectRatio)
+            created = self._ensure_secondary_view()
+            # Display in secondary view: one pixmap swap, then fit to the image's own rect
+            self._secondary_item.setPixmap(captured_pixmap)
+            self._fit_secondary_view()
+            if created:
+                # A view that just replaced its placeholder is only sized once the layout
+                # runs, so the fit above used a provisional viewport; refit after that
+                QTimer.singleShot(0, self._fit_secondary_view)
             
         except Exception as e:
             logger.error(f"Error capturing image: {e}")
 
+    def _fit_secondary_view(self):
+        """
+        Fit the captured image into the secondary view (a fixed scene rect also stops the
+        scene from recomputing its growing bounds). Refitting is only needed when the image
+        or the viewport changed size.
+        """
+        fit_key = (self._secondary_item.pixmap().size(), self.secondary_view.viewport().size())
+        if fit_key != self._secondary_fit:
+            self._secondary_fit = fit_key
+            image_rect = self._secondary_item.boundingRect()
+            self.secondary_scene.setSceneRect(image_rect)
+            self.secondary_view.fitInView(image_rect, Qt.KeepAspectRatio)
+
+    def _ensure_secondary_view(self):
+        """Build the captured image view in place of its placeholder, once; True if built now"""
+        if self.secondary_view is not None:
+            return False
+        self.secondary_view = QGraphicsView()
+        self.secondary_scene = QGraphicsScene()
+        self.secondary_scene.setItemIndexMethod(QGraphicsScene.NoIndex)
+        self.secondary_view.setScene(self.secondary_scene)
+        # One persistent item; each preview only swaps its pixmap. The image changes only on
+        # preview, so repaints (scrolling, resizes at the same scale) reuse the scaled raster
+        self._secondary_item = self.secondary_scene.addPixmap(QPixmap())
+        self._secondary_item.setCacheMode(QGraphicsItem.DeviceCoordinateCache)
+        # A single image fills the view, so repaint it whole rather than tracking dirty regions
+        self.secondary_view.setViewportUpdateMode(QGraphicsView.FullViewportUpdate)
+        self.secondary_view.setOptimizationFlags(QGraphicsView.DontAdjustForAntialiasing | QGraphicsView.DontSavePainterState)
+        if getattr(self.controller, 'opengl_viewport', True):
+            use_opengl_viewport(self.secondary_view)
+        self.secondary_view.setMinimumHeight(150)
+        self._secondary_frame_layout.replaceWidget(self._secondary_placeholder, self.secondary_view)
+        self._secondary_placeholder.deleteLater()
+        self._secondary_placeholder = None
+        return True
+    
+    @pyqtSlot()
     def on_capture_image(self):
         """Trigger capture/process and display on main view"""
         if hasattr(self.controller, "capture_process_frame"):
@@ -852,6 +843,7 @@ class EngineerTabView(QWidget):
         else:
             logger.error("Controller missing capture_process_frame")
     
+    @pyqtSlot()
     def on_motor_toggle_clicked(self):
         """Handle robot motor toggle button"""
         desired_state = self.motor_toggle_btn.isChecked()
@@ -874,25 +866,31 @@ class EngineerTabView(QWidget):
 
     def _update_motor_button(self, enabled):
         """Update motor toggle button text/state"""
-        self.motor_toggle_btn.blockSignals(True)
-        self.motor_toggle_btn.setChecked(enabled)
-        self.motor_toggle_btn.setText("Motor ON" if enabled else "Motor OFF")
-        self.motor_toggle_btn.blockSignals(False)
+        with QSignalBlocker(self.motor_toggle_btn):
+            self.motor_toggle_btn.setChecked(enabled)
+            self.motor_toggle_btn.setText("Motor ON" if enabled else "Motor OFF")
     
+    @pyqtSlot()
     def on_move_robot(self):
         """Move robot to specified coordinates"""
-        x = self.x_spinbox.value()
-        y = self.y_spinbox.value()
-        z = self.z_spinbox.value()
-        u = self.u_spinbox.value()
+        edits = (self.x_edit, self.y_edit, self.z_edit, self.u_edit)
+        if not all(edit.hasAcceptableInput() for edit in edits):
+            logger.warning("Move skipped: every coordinate needs an integer value")
+            return
+        x, y, z, u = (int(edit.text()) for edit in edits)
         
         if hasattr(self.controller, 'move_robot_to_position'):
             self.controller.move_robot_to_position(x, y, z, u)
         else:
             logger.error("Controller missing move_robot_to_position method")
     
+    @pyqtSlot(int)
+    def _on_preload_id_clicked(self, button_id):
+        """Map a preload button id to its section"""
+        self._preload_section(PRELOAD_SECTIONS[button_id])
+    
     def _preload_section(self, section_id):
-        """Preload position values from section config into spinboxes"""
+        """Preload position values from section config into the coordinate fields"""
         if not hasattr(self.controller, 'get_section_capture_position'):
             logger.error("Controller does not have get_section_capture_position method")
             return
@@ -902,10 +900,13 @@ class EngineerTabView(QWidget):
             logger.warning(f"Section {section_id} does not have a valid capture_position")
             return
         
-        self.x_spinbox.setValue(int(position[0]))
-        self.y_spinbox.setValue(int(position[1]))
-        self.z_spinbox.setValue(int(position[2]))
-        self.u_spinbox.setValue(int(position[3]))
+        for edit, value in zip((self.x_edit, self.y_edit, self.z_edit, self.u_edit), position):
+            edit.setText(str(int(value)))
+    
+    @pyqtSlot(int)
+    def _on_speed_id_clicked(self, button_id):
+        """Map a speed button id to its speed name"""
+        self.on_speed_selected(SPEED_NAMES[button_id])
     
     def on_speed_selected(self, speed):
         """Handle speed selection"""
@@ -916,63 +917,152 @@ class EngineerTabView(QWidget):
             logger.warning("Controller missing change_speed method")
     
     def update_display(self, frame, draw_cells=True):
-        """Update the display with the provided frame."""
+        """
+        Update the display with the provided frame.
+        Runs on the GUI thread, where QPixmap must be built; wrapping the frame in a QImage
+        is header-only, so there is no conversion work left to hand to another thread.
+        """
         if frame is None or self.scene is None:
             return
             
-        # Convert to QImage
-        if len(frame.shape) == 3:
-            h, w, c = frame.shape
-            qimg = QImage(frame.data, w, h, w * c, QImage.Format_RGB888)
-        else:
-            h, w = frame.shape
-            qimg = QImage(frame.data, w, h, w, QImage.Format_Grayscale8)
+        vision_view = self.vision_view
+        frame_label = self.frame_label
+        height, width = frame.shape[:2]
+        
+        # The operator label (shown instead of the vision view when zoom/pan are off) gets the
+        # frame scaled once to its size; the engineer scene keeps full resolution for zooming
+        target_size = frame_label.size() if frame_label is not None and not frame_label.isHidden() else None
+        
+        # The controller re-emits the same frame object when nothing changed (tab switches,
+        # toggles, flipping between paused view states); if it is already shown at this size
+        # there is nothing to do, and if it was shown recently its pixmap is reused. Frames
+        # are held in the cache, so their identity cannot be recycled by a new array.
+        display_key = None if target_size is None else (target_size.width(), target_size.height())
+        pixmap = None
+        for i, (cached_frame, cached_key, cached_pixmap) in enumerate(self._pixmap_cache):
+            if cached_frame is frame and cached_key == display_key:
+                if i == 0:
+                    return
+                pixmap = cached_pixmap
+                del self._pixmap_cache[i]
+                break
+        
+        if pixmap is None:
+            pixmap = self._frame_to_pixmap(frame, target_size)
+        self._pixmap_cache = [(frame, display_key, pixmap)] + self._pixmap_cache[:PIXMAP_CACHE_SIZE - 1]
+        
+        if target_size is not None:
+            frame_label.setPixmap(pixmap)
+            return
         
         # Update display
-        pixmap = QPixmap.fromImage(qimg)
         if self.pixmap_item is None:
             self.pixmap_item = self.scene.addPixmap(pixmap)
+            self.pixmap_item.setTransformationMode(Qt.FastTransformation)
+            # The pixmap is replaced every frame, so an item cache would never be reused
+            self.pixmap_item.setCacheMode(QGraphicsItem.NoCache)
         else:
             self.pixmap_item.setPixmap(pixmap)
         
-        # Set scene rect to match image size
-        self.scene.setSceneRect(0, 0, pixmap.width(), pixmap.height())
-        
-        # Adjust minimum scale of graphics view (if accessible)
-        if self.app_view and hasattr(self.app_view, 'vision_view'):
-            vision_view = self.app_view.vision_view
-            vision_view.set_min_scale(self.scene.sceneRect())
+        # Set scene rect and the view's minimum scale to match image size (only when it changes;
+        # GraphicsView recomputes the minimum scale itself when the viewport is resized)
+        if self._scene_size != (width, height):
+            self._scene_size = (width, height)
+            self.scene.setSceneRect(0, 0, width, height)
+            if vision_view is not None:
+                vision_view.set_min_scale(self.scene.sceneRect())
+    
+    def _frame_to_pixmap(self, frame, target_size=None):
+        """
+        Convert a grayscale or RGB frame to a QPixmap, optionally scaled to fit target_size.
+        The QImage only wraps the array, so it must not outlive this call.
+        """
+        # Controller frames are C-contiguous arrays that are never written after emit
+        # (see AppController.frame_updated), so the QImage wraps the frame itself; only
+        # crops/slices that are not C-contiguous are copied.
+        # RGB888 stays: Qt's RGB888 -> RGB32 pixmap conversion is cheaper than repacking
+        # the frame into a 4-byte ARGB32_Premultiplied buffer in Python first
+        contiguous = frame if frame.flags['C_CONTIGUOUS'] else np.ascontiguousarray(frame)
+        fmt, bytes_per_line = self._qimage_layout(contiguous.shape)
+        qimg = QImage(contiguous.data, contiguous.shape[1], contiguous.shape[0], bytes_per_line, fmt)
+        
+        if target_size is not None:
+            return QPixmap.fromImage(qimg.scaled(target_size, Qt.KeepAspectRatio, Qt.FastTransformation))
+        # A fresh pixmap per frame on purpose: the scene item holds an implicitly shared copy,
+        # so convertFromImage on a persistent QPixmap detaches (an extra copy) instead of
+        # reusing storage
+        return QPixmap.fromImage(qimg)
+    
+    def _qimage_layout(self, shape):
+        """Return the (QImage format, bytes per line) for a frame shape, cached per shape"""
+        layout = self._qimage_layouts.get(shape)
+        if layout is None:
+            if len(shape) == 3:
+                h, w, c = shape
+                layout = (QImage.Format_RGB888, w * c)
+            else:
+                h, w = shape
+                layout = (QImage.Format_Grayscale8, w)
+            self._qimage_layouts[shape] = layout
+        return layout
     
     def update_status(self, message):
         """Update status message"""
         # Status is handled in app_view
         pass
     
+    @pyqtSlot(float, float, float, float)
     def update_position_info(self, img_x, img_y, robot_x, robot_y):
-        """Update position labels and click history"""        
-        # Add to history
-        history_entry = f"Img ({img_x:.1f}, {img_y:.1f}) -> Robot ({robot_x:.2f}, {robot_y:.2f})"
-        self.click_history.append(history_entry)
-        if len(self.click_history) > self.max_history:
-            self.click_history.pop(0)
-        
-        # Update history text box
-        history_text_content = "\n".join(reversed(self.click_history))  # Most recent first
-        self.history_text.setPlainText(history_text_content)
+        """Queue a position update; bursts (e.g. arrow-key repeat) are written to the history together"""
+        self._pending_positions.append((img_x, img_y, robot_x, robot_y))
+        if not self._position_timer.isActive():
+            self._position_timer.start()
+    
+    @pyqtSlot()
+    def _apply_position_update(self):
+        """Add the queued positions to the click history"""
+        pending, self._pending_positions = self._pending_positions, []
+        entries = [f"Img ({img_x:.1f}, {img_y:.1f}) -> Robot ({robot_x:.2f}, {robot_y:.2f})"
+                   for img_x, img_y, robot_x, robot_y in pending]
+        self.click_history.extend(entries)
+        # Nobody sees the box while the tab is hidden (or not built yet); catch up on show
+        if not self.isVisible():
+            self._history_stale = True
+            return
+        
+        # Update history text box incrementally, most recent first: prepend the new lines and
+        # drop the oldest ones, instead of re-laying out the whole document
+        document = self.history_text.document()
+        new_text = "\n".join(reversed(entries))
+        cursor = QTextCursor(document)
+        if document.isEmpty():
+            cursor.insertText(new_text)
+        else:
+            cursor.insertText(new_text + "\n")
+        if document.blockCount() > self.max_history:
+            # Cut everything after the last kept line in one go; the box is editable, so the
+            # tail may hold empty lines a per-block selection would never remove
+            last_kept = document.findBlockByNumber(self.max_history - 1)
+            cursor.setPosition(last_kept.position() + last_kept.length() - 1)
+            cursor.movePosition(QTextCursor.End, QTextCursor.KeepAnchor)
+            cursor.removeSelectedText()
+    
+    def _fill_history(self):
+        """Show click_history in the history box, most recent first"""
+        self.history_text.setPlainText("\n".join(reversed(self.click_history)))
     
     def view_state_changed(self, state):
         """Handle view state change from UI"""
         self.controller.set_view_state(state)
     
-    def update_section_display(self, section_id):
-        """Update section display (no UI element, kept for compatibility)"""
-        pass
-    
     def _setup_network_monitoring(self):
-        """Setup network monitoring connections"""
+        """Setup network monitoring connections (monitoring itself is started by showEvent)"""
         if hasattr(self.controller, 'network_monitor'):
             self.controller.network_monitor.ping_status_changed.connect(self._on_ping_status_changed)
-            self.controller.start_network_monitoring()
+            # Show devices that came online before the tab was built
+            for ip, is_online in self.controller.network_monitor.get_all_statuses().items():
+                if is_online:
+                    self._on_ping_status_changed(ip, True)
         
         # Connect to controller signals for connection status updates
         if hasattr(self.controller, 'robot_connection_status_changed'):
@@ -989,25 +1079,45 @@ class EngineerTabView(QWidget):
                 initial_status = self.controller.is_camera_connected()
                 self._on_camera_connection_status_changed(initial_status)
     
+    @pyqtSlot(str, bool)
     def _on_ping_status_changed(self, ip: str, is_online: bool):
-        """Update ping status light for a device"""
-        if ip in self.ping_labels:
-            color = "green" if is_online else "red"
-            self.ping_labels[ip].setStyleSheet(f"color: {color};")
+        """Queue a ping status light update; pings finish in bursts, so they are applied together"""
+        self._pending_ping[ip] = "green" if is_online else "red"
+        if not self._ping_timer.isActive():
+            self._ping_timer.start()
+    
+    @pyqtSlot()
+    def _flush_ping_updates(self):
+        """Apply queued ping colors; the ping bar skips lights that already show them"""
+        # While hidden the colors stay queued; showEvent flushes them
+        if not self.isVisible():
+            return
+        pending, self._pending_ping = self._pending_ping, {}
+        for ip, color in pending.items():
+            self.ping_bar.set_status(ip, color)
     
+    @pyqtSlot(bool)
     def _on_robot_connection_status_changed(self, is_connected: bool):
-        """Update robot connection status UI"""
+        """Update robot connection status UI; repeated reports of the same state are ignored"""
+        if is_connected == self._robot_connected:
+            return
+        self._robot_connected = is_connected
         color = "green" if is_connected else "red"
-        self.robot_status_light.setStyleSheet(f"color: {color};")
+        self.robot_status_light.setPalette(get_status_palette(color))
     
+    @pyqtSlot(bool)
     def _on_camera_connection_status_changed(self, is_connected: bool):
-        """Update camera connection status UI"""
+        """Update camera connection status UI; repeated reports of the same state are ignored"""
+        if is_connected == self._camera_connected:
+            return
+        self._camera_connected = is_connected
         color = "green" if is_connected else "red"
-        self.camera_status_light.setStyleSheet(f"color: {color};")
+        self.camera_status_light.setPalette(get_status_palette(color))
         # Update exposure time when camera connects
         if is_connected:
             self._update_exposure_time_from_config()
     
+    @pyqtSlot()
     def on_robot_reconnect(self):
         """Handle robot reconnect button click"""
         if hasattr(self.controller, 'reconnect_robot'):
@@ -1015,6 +1125,7 @@ class EngineerTabView(QWidget):
         else:
             logger.warning("Controller missing reconnect_robot method")
     
+    @pyqtSlot()
     def on_camera_reconnect(self):
         """Handle camera reconnect button click"""
         if hasattr(self.controller, 'reconnect_camera'):
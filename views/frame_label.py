@@ -0,0 +1,30 @@
+from PyQt5.QtCore import Qt, pyqtSignal
+from PyQt5.QtWidgets import QLabel, QSizePolicy
+
+"""
+frame_label.py
+
+This module defines the FrameLabel class, a plain QLabel for showing camera frames
+where zoom, pan and click handling are not needed (Operator tab).
+
+Frames are scaled to the label once and drawn 1:1, skipping the scene and view
+transform of GraphicsView. The `resized` signal lets the owner rescale the current
+frame when the label changes size.
+"""
+
+
+class FrameLabel(QLabel):
+    """Lightweight frame display: a pre-scaled pixmap on a label"""
+    resized = pyqtSignal()
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.setAlignment(Qt.AlignCenter)
+        # The layout sizes the label and the pixmap is scaled to fit, never the other way round
+        self.setSizePolicy(QSizePolicy.Ignored, QSizePolicy.Ignored)
+        self.setMinimumSize(1, 1)
+
+    def resizeEvent(self, event):
+        """Notify the owner so the current frame can be rescaled"""
+        super().resizeEvent(event)
+        self.resized.emit()
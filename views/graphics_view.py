@@ -1,5 +1,12 @@
-from PyQt5.QtCore import Qt, QRectF
-from PyQt5.QtWidgets import QGraphicsView
+from PyQt5.QtCore import Qt, QTimer
+from PyQt5.QtGui import QOpenGLContext, QSurfaceFormat
+from PyQt5.QtWidgets import QGraphicsView, QOpenGLWidget
+import time
+
+from utils.logger_config import get_logger
+from utils.latency_tracker import LatencyTracker
+
+logger = get_logger("GraphicsView")
 
 """
 graphics_view.py
@@ -9,16 +16,38 @@ displaying images with the following key features:
 
 Key Features:
 - Mouse wheel zoom with zoom-out restriction to prevent excessive scaling.
+- Wheel and button zoom throttled to one transform change per ~16 ms (queue_zoom).
 - Panning support (can be enabled/disabled per tab).
 - Click handling for calibration (can be enabled/disabled per tab).
 - Dynamic minimum zoom scale based on the image and viewport size.
+- Optional OpenGL viewport, since the whole image is redrawn on every frame.
+- Paint time percentiles logged at debug level for render tuning.
 
 Use `set_min_scale(scene_rect)` to initialize the minimum zoom scale.
 """
 
 
+def use_opengl_viewport(view):
+    """Render a QGraphicsView through a QOpenGLWidget if an OpenGL context can be created; returns success"""
+    if not QOpenGLContext().create():
+        return False
+    viewport = QOpenGLWidget()
+    surface_format = QSurfaceFormat()
+    surface_format.setSwapInterval(1)  # Sync buffer swaps to the display refresh
+    viewport.setFormat(surface_format)
+    view.setViewport(viewport)
+    return True
+
+
 class GraphicsView(QGraphicsView):
     """Enhanced GraphicsView for vision display with zoom and pan"""
+    # Full repaints suit a frame pixmap that covers the view. BoundingRectViewportUpdate
+    # repaints only the changed item's bounds and can win when the frame is zoomed out
+    # to less than the viewport; switch here to compare on the target hardware.
+    VIEWPORT_UPDATE_MODE = QGraphicsView.FullViewportUpdate
+    # Zoom requests arriving faster than this are merged into one transform change (~60 Hz)
+    ZOOM_INTERVAL_MS = 16
+
     def __init__(self, parent=None, enable_pan=False):
         super().__init__(parent)
         self.enable_pan = enable_pan
@@ -26,12 +55,27 @@ class GraphicsView(QGraphicsView):
         self.enable_click = True
         self.setDragMode(QGraphicsView.ScrollHandDrag if enable_pan else QGraphicsView.NoDrag)
         self.setTransformationAnchor(QGraphicsView.AnchorUnderMouse)
+        # The camera pixmap changes every frame, so skip fine-grained dirty-region
+        # bookkeeping and the per-item painter save/restore
+        self.setViewportUpdateMode(self.VIEWPORT_UPDATE_MODE)
+        self.setOptimizationFlags(QGraphicsView.DontAdjustForAntialiasing | QGraphicsView.DontSavePainterState)
         self.scale_factor = 1.0
         self.min_scale = 1.0
         self.last_press_pos = None
         self.last_press_button = None
         self.main_window = parent  # Store reference to main window
+        self.paint_latency = LatencyTracker("Vision view paint", logger)
+        # Zoom factor queued by queue_zoom, applied when _zoom_timer fires
+        self._pending_zoom = 1.0
+        self._zoom_timer = QTimer(self)
+        self._zoom_timer.setSingleShot(True)
+        self._zoom_timer.setInterval(self.ZOOM_INTERVAL_MS)
+        self._zoom_timer.timeout.connect(self._apply_pending_zoom)
         
+    def use_opengl_viewport(self):
+        """Render through a QOpenGLWidget if an OpenGL context can be created; returns success"""
+        return use_opengl_viewport(self)
+    
     def set_pan_enabled(self, enabled):
         """Enable or disable panning"""
         self.enable_pan = enabled
@@ -45,16 +89,15 @@ class GraphicsView(QGraphicsView):
         """Enable or disable click handling"""
         self.enable_click = enabled
 
+    def _fit_scale(self, rect):
+        """Scale at which rect just fits in the viewport"""
+        return min(self.viewport().width() / rect.width(), self.viewport().height() / rect.height())
+
     def set_min_scale(self, scene_rect):
         """Calculate and set the minimum scale based on the scene and view size."""
-        view_width = self.viewport().width()
-        view_height = self.viewport().height()
-        scene_width = scene_rect.width()
-        scene_height = scene_rect.height()
-
-        if scene_width > 0 and scene_height > 0:
+        if scene_rect.width() > 0 and scene_rect.height() > 0:
             # Set minimum scale to fit the image in the view
-            self.min_scale = min(view_width / scene_width, view_height / scene_height)
+            self.min_scale = self._fit_scale(scene_rect)
             
             # Only reset transform if we're currently zoomed out beyond the minimum
             if self.scale_factor < self.min_scale:
@@ -62,25 +105,46 @@ class GraphicsView(QGraphicsView):
                 self.scale(self.min_scale, self.min_scale)
                 self.scale_factor = self.min_scale
 
-    def wheelEvent(self, event):
-        """Handle mouse wheel zoom"""
+    def zoom_by(self, zoom_factor):
+        """Zoom by zoom_factor, refusing to zoom out past the minimum scale"""
         if not self.enable_zoom:
             return
-        
-        zoom_in_factor = 1.1
-        zoom_out_factor = 1 / zoom_in_factor
-        
-        if event.angleDelta().y() > 0:
-            zoom_factor = zoom_in_factor
-        else:
-            if self.scale_factor > self.min_scale:
-                zoom_factor = zoom_out_factor
-            else:
-                return
+        # Merged zoom-outs can be several steps at once; stop exactly at the minimum scale
+        zoom_factor = max(zoom_factor, self.min_scale / self.scale_factor)
+        if zoom_factor == 1.0 or (zoom_factor < 1 and self.scale_factor <= self.min_scale):
+            return
         
         self.scale(zoom_factor, zoom_factor)
         self.scale_factor *= zoom_factor
-        self.scale_factor = max(self.scale_factor, self.min_scale)
+
+    def queue_zoom(self, zoom_factor):
+        """Zoom by zoom_factor, merging requests that arrive within ZOOM_INTERVAL_MS"""
+        self._pending_zoom *= zoom_factor
+        if not self._zoom_timer.isActive():
+            # Apply the first request right away; later ones in the window wait for the timer
+            self._apply_pending_zoom()
+            self._zoom_timer.start()
+
+    def _apply_pending_zoom(self):
+        """Apply the queued zoom factor as a single transform change"""
+        zoom_factor, self._pending_zoom = self._pending_zoom, 1.0
+        if zoom_factor != 1.0:
+            self.zoom_by(zoom_factor)
+
+    def paintEvent(self, event):
+        """Paint the scene and record how long it took"""
+        start = time.perf_counter()
+        super().paintEvent(event)
+        self.paint_latency.add(time.perf_counter() - start)
+
+    def resizeEvent(self, event):
+        """Keep the minimum zoom scale in step with the viewport size"""
+        super().resizeEvent(event)
+        self.set_min_scale(self.sceneRect())
+
+    def wheelEvent(self, event):
+        """Handle mouse wheel zoom; fast scrolling is merged into one transform change per frame"""
+        self.queue_zoom(1.1 if event.angleDelta().y() > 0 else 1 / 1.1)
     
     def mousePressEvent(self, event):
         """Handle mouse click for calibration point selection or pan"""
@@ -121,6 +185,7 @@ class GraphicsView(QGraphicsView):
     
     def reset_view(self):
         """Reset zoom and fit image to view"""
+        self._pending_zoom = 1.0  # Zooms queued before the reset no longer apply
         scene = self.scene()
         if scene and scene.items():
             self.resetTransform()
@@ -130,9 +195,7 @@ class GraphicsView(QGraphicsView):
                 self.fitInView(items_rect, Qt.KeepAspectRatio)
                 # Update min_scale after fitInView
                 if items_rect.width() > 0 and items_rect.height() > 0:
-                    view_width = self.viewport().width()
-                    view_height = self.viewport().height()
-                    self.min_scale = min(view_width / items_rect.width(), view_height / items_rect.height())
+                    self.min_scale = self._fit_scale(items_rect)
                     self.scale_factor = self.min_scale
 
     def keyPressEvent(self, event):
@@ -0,0 +1,91 @@
+from PyQt5.QtCore import Qt, QRect, QSize
+from PyQt5.QtGui import QColor, QFont, QFontMetrics, QPainter
+from PyQt5.QtWidgets import QSizePolicy, QStyle, QStyleOption, QWidget
+
+from utils.ui_styles import get_qcolor
+
+"""
+ping_bar.py
+
+This module defines the PingBarWidget class, which shows one column per network
+device: the device name with a colored status dot below it.
+
+Everything is painted in a single paintEvent instead of using a label per name and
+per dot, so a status change repaints one dot and never touches a layout. The panel
+background and border still come from the stylesheet (QWidget#pingTable).
+"""
+
+
+class PingBarWidget(QWidget):
+    """Device names and ping status dots painted by one widget"""
+    DOT_SIZE = 14
+    ROW_SPACING = 15
+
+    def __init__(self, devices, name_font=None, parent=None):
+        """devices maps IP to display name; columns follow its order"""
+        super().__init__(parent)
+        self._devices = list(devices.items())
+        self._index = {ip: i for i, (ip, _) in enumerate(self._devices)}
+        self._colors = {ip: "gray" for ip in self._index}
+        self._name_font = QFont(name_font) if name_font is not None else QFont(self.font())
+        self._name_font.setBold(True)
+        self._name_color = get_qcolor('gray_muted')
+        metrics = QFontMetrics(self._name_font)
+        self._name_height = metrics.height()
+        self._name_widths = [metrics.horizontalAdvance(name) for _, name in self._devices]
+        self.setContentsMargins(10, 10, 10, 10)
+        self.setSizePolicy(QSizePolicy.Preferred, QSizePolicy.Fixed)
+
+    def set_status(self, ip, color):
+        """Show `color` (a Qt color name) for a device; repaints only its dot, and only on change"""
+        index = self._index.get(ip)
+        if index is None or self._colors[ip] == color:
+            return
+        self._colors[ip] = color
+        # One pixel of slack for the antialiased edge
+        self.update(self._dot_rect(index).adjusted(-1, -1, 1, 1))
+
+    def sizeHint(self):
+        margins = self.contentsMargins()
+        height = self._name_height + self.ROW_SPACING + self.DOT_SIZE + margins.top() + margins.bottom()
+        width = sum(self._name_widths) + self.ROW_SPACING * len(self._devices) + margins.left() + margins.right()
+        return QSize(width, height)
+
+    def minimumSizeHint(self):
+        return self.sizeHint()
+
+    def _column_rect(self, index):
+        """Area of one device column: its name width plus an equal share of the spare width"""
+        area = self.contentsRect()
+        count = len(self._devices)
+        spare = area.width() - sum(self._name_widths)
+        left = area.x() + sum(self._name_widths[:index]) + spare * index // count
+        right = area.x() + sum(self._name_widths[:index + 1]) + spare * (index + 1) // count
+        return QRect(left, area.y(), right - left, area.height())
+
+    def _dot_rect(self, index):
+        """Bounding box of a device's status dot, centered below its name"""
+        column = self._column_rect(index)
+        x = column.center().x() - self.DOT_SIZE // 2
+        y = column.y() + self._name_height + self.ROW_SPACING
+        return QRect(x, y, self.DOT_SIZE, self.DOT_SIZE)
+
+    def paintEvent(self, event):
+        painter = QPainter(self)
+        # Let the stylesheet draw the panel background and border
+        option = QStyleOption()
+        option.initFrom(self)
+        self.style().drawPrimitive(QStyle.PE_Widget, option, painter, self)
+
+        painter.setRenderHint(QPainter.Antialiasing)
+        painter.setFont(self._name_font)
+        for index, (ip, name) in enumerate(self._devices):
+            column = self._column_rect(index)
+            if not event.rect().intersects(column):
+                continue
+            painter.setPen(self._name_color)
+            painter.drawText(QRect(column.x(), column.y(), column.width(), self._name_height),
+                             Qt.AlignCenter, name)
+            painter.setPen(Qt.NoPen)
+            painter.setBrush(QColor(self._colors[ip]))
+            painter.drawEllipse(self._dot_rect(index))
@@ -1,6 +1,5 @@
-from PyQt5.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QLabel, 
+from PyQt5.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout,
                              QPushButton, QGroupBox, QButtonGroup, QGridLayout)
-from PyQt5.QtGui import QFont
 
 from utils.logger_config import get_logger
 